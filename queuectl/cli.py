@@ -4,38 +4,160 @@ QueueCTL - CLI-based Background Job Queue System
 Command-line interface implementation
 """
 
-import click
-import json
+import argparse
+import functools
 import sys
-import time
-from typing import Optional
+import textwrap
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-from queuectl.core import QueueManager, WorkerManager
-from queuectl.utils import Config
+if TYPE_CHECKING:
+    from queuectl.core import QueueManager, WorkerManager
+    from queuectl.utils import Config
 
 
-# Initialize components
-config = Config()
-queue_manager = QueueManager(config)
-worker_manager = WorkerManager(queue_manager, config)
+# Components are created on first use so that --help, --version and
+# commands that never touch the queue don't open the database.
+# The imports live here too: queuectl.core pulls in storage and models.
+@functools.lru_cache(None)
+def _config() -> 'Config':
+    from queuectl.utils import Config
+    return Config()
 
 
-@click.group()
-@click.version_option(version='1.0.0')
-def cli():
+@functools.lru_cache(None)
+def _qm() -> 'QueueManager':
+    from queuectl.core import QueueManager
+    # Only `worker start` recovers stuck jobs: other commands may run while
+    # worker processes hold jobs in processing state
+    return QueueManager(_config(), recover=False)
+
+
+@functools.lru_cache(None)
+def _wm() -> 'WorkerManager':
+    from queuectl.core import WorkerManager
+    return WorkerManager(_qm(), _config())
+
+
+def reset():
     """
-    QueueCTL - Background Job Queue System
+    Drop the cached components, as if the next command ran in a new process
+    
+    Writes out and closes the queue manager, saves the configuration and
+    restores the signal handlers the worker manager installed. For running
+    several commands in one process, e.g. in tests.
+    """
+    if _wm.cache_info().currsize:
+        _wm().restore_signal_handlers()
+    if _qm.cache_info().currsize:
+        _qm().close()
+    if _config.cache_info().currsize:
+        _config().flush()
+    for factory in (_wm, _qm, _config):
+        factory.cache_clear()
+
+
+# Job states accepted by --state, in display order
+JOB_STATES = ('pending', 'processing', 'completed', 'failed', 'dead')
+VALID_STATES = frozenset(JOB_STATES)
+
+# Columns fetched for job tables and their row layouts (shared by the
+# header and every row)
+LIST_COLUMNS = ('id', 'state', 'command', 'attempts', 'max_retries', 'updated_at')
+DLQ_COLUMNS = ('id', 'command', 'attempts', 'error_message')
+LIST_ROW_FORMAT = "{:<20} {:<12} {:<35} {:<10} {}".format
+DLQ_ROW_FORMAT = "{:<20} {:<45} {:<10} {:<30}".format
+
+
+def _check_non_negative(value):
+    if value < 0:
+        raise ValueError("Value must be non-negative")
+
+
+def _check_positive(value):
+    if value <= 0:
+        raise ValueError("Value must be positive")
+
+
+def _check_poll_interval(value):
+    _check_non_negative(value)
+    if value < 1:
+        raise ValueError("Poll interval must be at least 1 second")
+
+
+# Settable configuration keys: CLI name -> (config key, type, validator)
+CONFIG_KEYS = {
+    'max-retries': ('max_retries', int, _check_non_negative),
+    'backoff-base': ('backoff_base', float, _check_positive),
+    'job-timeout': ('job_timeout', int, _check_non_negative),
+    'poll-interval': ('poll_interval', int, _check_poll_interval),
+    'batch-size': ('batch_size', int, _check_positive),
+    'worker-shutdown-timeout': ('worker_shutdown_timeout', int, _check_non_negative),
+}
+
+
+def _parse_config_setting(key: str, value: str) -> Tuple[str, Any]:
+    """
+    Validate a CLI configuration setting
     
-    A production-grade CLI tool for managing background jobs with
-    automatic retries, exponential backoff, and Dead Letter Queue.
+    Args:
+        key: CLI key name (kebab-case)
+        value: Raw value from the command line
+        
+    Returns:
+        Tuple of (config key, converted value)
+        
+    Raises:
+        KeyError: If key is not a settable configuration key
+        ValueError: If value has the wrong type or fails validation
     """
-    pass
+    config_key, value_type, validate = CONFIG_KEYS[key]
+    value = value_type(value)
+    validate(value)
+    return config_key, value
+
+
+def _truncate(text: str, width: int) -> str:
+    """Shorten text to at most width characters, marking cuts with '...'"""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def _write_json(payload: Any):
+    """
+    Write payload to stdout as one line of JSON, using orjson when installed
+    
+    Args:
+        payload: JSON-serializable object
+    """
+    try:
+        import orjson
+        data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    except ImportError:
+        import json
+        data = (json.dumps(payload, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+
+
+def _json_loads(data):
+    """
+    Parse JSON text or bytes, using orjson when it is installed
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        Parsed object
+        
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    return loads(data)
 
 
-@cli.command()
-@click.argument('job_id')
-@click.argument('command')
-@click.option('--max-retries', '-r', type=int, help='Maximum retry attempts')
 def add(job_id: str, command: str, max_retries: Optional[int]):
     """
     Quick way to add a job (no JSON needed).
@@ -52,33 +174,27 @@ def add(job_id: str, command: str, max_retries: Optional[int]):
     """
     try:
         # Enqueue job
-        job = queue_manager.enqueue(
+        job = _qm().enqueue(
             job_id=job_id,
             command=command,
-            max_retries=max_retries if max_retries is not None else config.get('max_retries')
+            max_retries=max_retries if max_retries is not None else _config().get('max_retries')
         )
         
         # Success output
-        click.echo(f"✓ Job added successfully")
-        click.echo(f"  ID:          {job.id}")
-        click.echo(f"  Command:     {job.command}")
-        click.echo(f"  Max Retries: {job.max_retries}")
+        print(f"✓ Job added successfully")
+        print(f"  ID:          {job.id}")
+        print(f"  Command:     {job.command}")
+        print(f"  Max Retries: {job.max_retries}")
         
     except ValueError as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@cli.command()
-@click.argument('job_data', required=False)
-@click.option('--file', '-f', type=click.File('r'), help='Read job data from file')
-@click.option('--id', '-i', help='Job ID (alternative to JSON)')
-@click.option('--command', '-c', help='Command to execute (alternative to JSON)')
-@click.option('--max-retries', '-r', type=int, help='Maximum retry attempts')
-def enqueue(job_data: Optional[str], file, id: Optional[str], command: Optional[str], max_retries: Optional[int]):
+def enqueue(job_data: Optional[str], file: Optional[str], id: Optional[str], command: Optional[str], max_retries: Optional[int]):
     """
     Enqueue a new job to the queue.
     
@@ -102,6 +218,8 @@ def enqueue(job_data: Optional[str], file, id: Optional[str], command: Optional[
     
         queuectl enqueue "{\"id\":\"job1\",\"command\":\"echo Hello\"}"
     """
+    import json
+
     try:
         # Mode 1: Simple arguments (--id and --command)
         if id and command:
@@ -116,65 +234,101 @@ def enqueue(job_data: Optional[str], file, id: Optional[str], command: Optional[
         else:
             # Read from file if specified
             if file:
-                job_data = file.read()
+                with open(file, 'rb') as f:
+                    job_data = f.read()
             # Read from stdin if job_data is "-"
             elif job_data == "-":
-                job_data = sys.stdin.read()
+                job_data = sys.stdin.buffer.read()
             elif not job_data:
-                click.echo("❌ Error: Either provide JSON or use --id and --command", err=True)
-                click.echo("", err=True)
-                click.echo("Simple mode:", err=True)
-                click.echo("   queuectl enqueue --id job1 --command \"echo Hello\"", err=True)
-                click.echo("", err=True)
-                click.echo("JSON mode:", err=True)
-                click.echo("   queuectl enqueue '{\"id\":\"job1\",\"command\":\"echo Hello\"}'", err=True)
+                print("❌ Error: Either provide JSON or use --id and --command", file=sys.stderr)
+                print("", file=sys.stderr)
+                print("Simple mode:", file=sys.stderr)
+                print("   queuectl enqueue --id job1 --command \"echo Hello\"", file=sys.stderr)
+                print("", file=sys.stderr)
+                print("JSON mode:", file=sys.stderr)
+                print("   queuectl enqueue '{\"id\":\"job1\",\"command\":\"echo Hello\"}'", file=sys.stderr)
                 sys.exit(1)
             
-            job_dict = json.loads(job_data)
+            job_dict = _json_loads(job_data)
         
         # Validate required fields
         if 'id' not in job_dict:
-            click.echo("❌ Error: Job must contain 'id' field", err=True)
+            print("❌ Error: Job must contain 'id' field", file=sys.stderr)
             sys.exit(1)
             
         if 'command' not in job_dict:
-            click.echo("❌ Error: Job must contain 'command' field", err=True)
+            print("❌ Error: Job must contain 'command' field", file=sys.stderr)
             sys.exit(1)
         
         # Enqueue job
-        job = queue_manager.enqueue(
+        job = _qm().enqueue(
             job_id=job_dict['id'],
             command=job_dict['command'],
-            max_retries=job_dict.get('max_retries', config.get('max_retries'))
+            max_retries=job_dict.get('max_retries', _config().get('max_retries'))
         )
         
         # Success output
-        click.echo(f"✓ Job enqueued successfully")
-        click.echo(f"  ID:          {job.id}")
-        click.echo(f"  Command:     {job.command}")
-        click.echo(f"  Max Retries: {job.max_retries}")
-        click.echo(f"  Created:     {job.created_at}")
+        print(f"✓ Job enqueued successfully")
+        print(f"  ID:          {job.id}")
+        print(f"  Command:     {job.command}")
+        print(f"  Max Retries: {job.max_retries}")
+        print(f"  Created:     {job.created_at}")
         
     except json.JSONDecodeError as e:
-        click.echo(f"❌ Error: Invalid JSON format - {str(e)}", err=True)
+        print(f"❌ Error: Invalid JSON format - {str(e)}", file=sys.stderr)
         sys.exit(1)
     except ValueError as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@cli.group()
-def worker():
-    """Manage worker processes"""
-    pass
+def enqueue_batch(file: str):
+    """
+    Enqueue many jobs at once from a JSON array.
+    
+    All jobs are added in a single transaction: if any job is invalid
+    or its ID already exists, nothing is enqueued.
+    
+    Example:
+    
+        queuectl enqueue-batch jobs.json
+        
+        cat jobs.json | queuectl enqueue-batch -
+    
+    Where jobs.json contains:
+    
+        [{"id":"job1","command":"echo one"}, {"id":"job2","command":"echo two","max_retries":5}]
+    """
+    import json
 
+    try:
+        if file == "-":
+            data = sys.stdin.buffer.read()
+        else:
+            with open(file, 'rb') as f:
+                data = f.read()
+        
+        specs = _json_loads(data)
+        if not isinstance(specs, list):
+            print("❌ Error: Batch file must contain a JSON array of jobs", file=sys.stderr)
+            sys.exit(1)
+        
+        jobs = _qm().enqueue_many(specs)
+        
+        print(f"✓ {len(jobs)} job(s) enqueued successfully")
+        
+    except json.JSONDecodeError as e:
+        print(f"❌ Error: Invalid JSON format - {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
 
-@worker.command()
-@click.option('--count', '-c', default=1, help='Number of workers to start', type=int)
-def start(count: int):
+
+def worker_start(count: int):
     """
     Start worker processes to execute jobs.
     
@@ -187,49 +341,44 @@ def start(count: int):
     """
     try:
         if count < 1:
-            click.echo("❌ Error: Worker count must be at least 1", err=True)
+            print("❌ Error: Worker count must be at least 1", file=sys.stderr)
             sys.exit(1)
         
-        worker_manager.start_workers(count)
-        click.echo(f"✓ Started {count} worker(s)")
-        click.echo("  Workers are processing jobs...")
-        click.echo("  Press Ctrl+C to stop workers gracefully")
-        click.echo("")
+        # Show retry/DLQ decisions from the queue manager alongside worker output
+        import logging
+        logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
         
-        # Keep main thread alive and handle Ctrl+C
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            pass  # Let the except block below handle it
+        _qm().recover_processing_jobs()
+        _wm().start_workers(count)
+        print(f"✓ Started {count} worker(s)")
+        print("  Workers are processing jobs...")
+        print("  Press Ctrl+C to stop workers gracefully")
+        print("")
+        
+        # Block until Ctrl+C or SIGTERM: WorkerManager's signal handler
+        # stops the workers gracefully and exits
+        _wm().wait()
             
-    except KeyboardInterrupt:
-        click.echo("\n⚠ Stopping workers gracefully...")
-        worker_manager.stop_workers()
-        click.echo("✓ All workers stopped")
-        sys.exit(0)
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@worker.command()
-def stop():
+def worker_stop():
     """
     Stop all running workers gracefully.
     
     Workers will finish their current jobs before stopping.
     """
     try:
-        worker_manager.stop_workers()
-        click.echo("✓ All workers stopped")
+        _wm().stop_workers()
+        print("✓ All workers stopped")
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@cli.command()
-def status():
+def status(as_json: bool):
     """
     Show system status and job statistics.
     
@@ -237,46 +386,61 @@ def status():
     - Job counts by state
     - Active worker count
     - Current configuration
+    
+    Use --json for machine-readable output.
     """
     try:
-        stats = queue_manager.get_stats()
-        worker_stats = worker_manager.get_status()
-        
-        click.echo("=" * 60)
-        click.echo("QueueCTL Status")
-        click.echo("=" * 60)
-        
-        click.echo(f"\n📊 Job Statistics:")
-        click.echo(f"  Pending:    {stats['pending']:>5}")
-        click.echo(f"  Processing: {stats['processing']:>5}")
-        click.echo(f"  Completed:  {stats['completed']:>5}")
-        click.echo(f"  Failed:     {stats['failed']:>5}")
-        click.echo(f"  Dead (DLQ): {stats['dead']:>5}")
-        click.echo(f"  {'─' * 20}")
-        click.echo(f"  Total:      {stats['total']:>5}")
-        
-        click.echo(f"\n👷 Workers:")
-        click.echo(f"  Total:      {worker_stats['total']:>5}")
-        click.echo(f"  Active:     {worker_stats['active']:>5}")
-        click.echo(f"  Busy:       {worker_stats['busy']:>5}")
-        click.echo(f"  Idle:       {worker_stats['idle']:>5}")
-        
-        click.echo(f"\n⚙️  Configuration:")
-        click.echo(f"  Max Retries:   {config.get('max_retries')}")
-        click.echo(f"  Backoff Base:  {config.get('backoff_base')}")
-        click.echo(f"  Job Timeout:   {config.get('job_timeout')}s")
-        
-        click.echo("=" * 60)
+        stats = _qm().get_stats()
+        worker_stats = _wm().get_status()
+        
+        if as_json:
+            _write_json({
+                'jobs': stats,
+                'workers': worker_stats,
+                'config': {
+                    'max_retries': _config().get('max_retries'),
+                    'backoff_base': _config().get('backoff_base'),
+                    'job_timeout': _config().get('job_timeout'),
+                },
+            })
+            return
+        
+        # Build the whole report and write it in one go
+        out = []
+        out.append("=" * 60)
+        out.append("QueueCTL Status")
+        out.append("=" * 60)
+        
+        out.append(f"\n📊 Job Statistics:")
+        out.append(f"  Pending:    {stats['pending']:>5}")
+        out.append(f"  Processing: {stats['processing']:>5}")
+        out.append(f"  Completed:  {stats['completed']:>5}")
+        out.append(f"  Failed:     {stats['failed']:>5}")
+        out.append(f"  Dead (DLQ): {stats['dead']:>5}")
+        out.append(f"  {'─' * 20}")
+        out.append(f"  Total:      {stats['total']:>5}")
+        
+        out.append(f"\n👷 Workers:")
+        out.append(f"  Total:      {worker_stats['total']:>5}")
+        out.append(f"  Active:     {worker_stats['active']:>5}")
+        out.append(f"  Busy:       {worker_stats['busy']:>5}")
+        out.append(f"  Idle:       {worker_stats['idle']:>5}")
+        
+        out.append(f"\n⚙️  Configuration:")
+        out.append(f"  Max Retries:   {_config().get('max_retries')}")
+        out.append(f"  Backoff Base:  {_config().get('backoff_base')}")
+        out.append(f"  Job Timeout:   {_config().get('job_timeout')}s")
+        
+        out.append("=" * 60)
+        
+        sys.stdout.write("\n".join(out) + "\n")
         
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@cli.command()
-@click.option('--state', '-s', help='Filter by state (pending, processing, completed, failed, dead)')
-@click.option('--limit', '-l', default=10, help='Maximum number of jobs to display', type=int)
-def list(state: Optional[str], limit: int):
+def list_jobs(state: Optional[str], limit: int, offset: int, as_json: bool):
     """
     List jobs, optionally filtered by state.
     
@@ -287,85 +451,99 @@ def list(state: Optional[str], limit: int):
         queuectl list --state pending
         
         queuectl list --state completed --limit 20
+        
+        queuectl list --limit 20 --offset 20
+        
+        queuectl list --state dead --json
     """
     try:
         # Validate state if provided
-        valid_states = ['pending', 'processing', 'completed', 'failed', 'dead']
-        if state and state not in valid_states:
-            click.echo(f"❌ Error: Invalid state '{state}'", err=True)
-            click.echo(f"   Valid states: {', '.join(valid_states)}", err=True)
+        if state and state not in VALID_STATES:
+            print(f"❌ Error: Invalid state '{state}'", file=sys.stderr)
+            print(f"   Valid states: {', '.join(JOB_STATES)}", file=sys.stderr)
             sys.exit(1)
         
-        jobs = queue_manager.list_jobs(state=state, limit=limit)
+        rows = _qm().list_jobs_summary(
+            state=state, limit=limit, offset=offset, columns=LIST_COLUMNS
+        )
         
-        if not jobs:
-            click.echo(f"No jobs found{f' with state: {state}' if state else ''}")
+        if as_json:
+            _write_json([dict(zip(LIST_COLUMNS, row)) for row in rows])
+            return
+        
+        if not rows:
+            print(f"No jobs found{f' with state: {state}' if state else ''}")
             return
         
         # Header
-        click.echo(f"\n{'ID':<20} {'State':<12} {'Command':<35} {'Attempts':<10} {'Updated'}")
-        click.echo("─" * 110)
+        fmt = LIST_ROW_FORMAT
+        out = []
+        out.append("\n" + fmt('ID', 'State', 'Command', 'Attempts', 'Updated'))
+        out.append("─" * 110)
         
         # Job rows
-        for job in jobs:
-            cmd_preview = job.command[:32] + "..." if len(job.command) > 35 else job.command
-            updated_short = job.updated_at[:19] if job.updated_at else "N/A"
-            click.echo(
-                f"{job.id:<20} {job.state:<12} {cmd_preview:<35} "
-                f"{job.attempts}/{job.max_retries:<8} {updated_short}"
+        out.extend(
+            fmt(
+                job_id, job_state, _truncate(command, 35),
+                f"{attempts}/{max_retries}",
+                updated_at[:19] if updated_at else "N/A"
             )
+            for job_id, job_state, command, attempts, max_retries, updated_at in rows
+        )
         
-        click.echo(f"\nShowing {len(jobs)} job(s){f' with state: {state}' if state else ''}")
+        out.append(f"\nShowing {len(rows)} job(s){f' with state: {state}' if state else ''}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
         
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@cli.group()
-def dlq():
-    """Manage Dead Letter Queue (DLQ)"""
-    pass
-
-
-@dlq.command(name='list')
-@click.option('--limit', '-l', default=10, help='Maximum number of jobs to display', type=int)
-def dlq_list(limit: int):
+def dlq_list(limit: int, as_json: bool):
     """
     List jobs in the Dead Letter Queue.
     
     Shows jobs that have exhausted all retry attempts.
+    Use --json for machine-readable output.
     """
     try:
-        jobs = queue_manager.list_jobs(state='dead', limit=limit)
+        rows = _qm().list_jobs_summary(state='dead', limit=limit, columns=DLQ_COLUMNS)
+        
+        if as_json:
+            _write_json([dict(zip(DLQ_COLUMNS, row)) for row in rows])
+            return
         
-        if not jobs:
-            click.echo("✓ No jobs in Dead Letter Queue")
+        if not rows:
+            print("✓ No jobs in Dead Letter Queue")
             return
         
         # Header
-        click.echo(f"\n{'ID':<20} {'Command':<45} {'Attempts':<10} {'Error':<30}")
-        click.echo("─" * 120)
+        fmt = DLQ_ROW_FORMAT
+        out = []
+        out.append("\n" + fmt('ID', 'Command', 'Attempts', 'Error'))
+        out.append("─" * 120)
         
         # Job rows
-        for job in jobs:
-            cmd_preview = job.command[:42] + "..." if len(job.command) > 45 else job.command
-            error_preview = (job.error_message[:27] + "...") if job.error_message and len(job.error_message) > 30 else (job.error_message or "N/A")
-            click.echo(
-                f"{job.id:<20} {cmd_preview:<45} {job.attempts:<10} {error_preview:<30}"
+        out.extend(
+            fmt(
+                job_id, _truncate(command, 45), attempts,
+                _truncate(error_message, 30) if error_message else "N/A"
             )
+            for job_id, command, attempts, error_message in rows
+        )
         
-        click.echo(f"\n💀 {len(jobs)} job(s) in Dead Letter Queue")
-        click.echo("   Use 'queuectl dlq retry <job-id>' to retry a job")
+        out.append(f"\n💀 {len(rows)} job(s) in Dead Letter Queue")
+        out.append("   Use 'queuectl dlq retry <job-id>' to retry a job")
+        
+        sys.stdout.write("\n".join(out) + "\n")
         
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@dlq.command()
-@click.argument('job_id')
-def retry(job_id: str):
+def dlq_retry(job_id: str):
     """
     Retry a job from the Dead Letter Queue.
     
@@ -376,30 +554,21 @@ def retry(job_id: str):
         queuectl dlq retry job-123
     """
     try:
-        success = queue_manager.retry_dlq_job(job_id)
+        success = _qm().retry_dlq_job(job_id)
         
         if success:
-            click.echo(f"✓ Job '{job_id}' moved from DLQ back to pending queue")
-            click.echo(f"  The job will be processed by the next available worker")
+            print(f"✓ Job '{job_id}' moved from DLQ back to pending queue")
+            print(f"  The job will be processed by the next available worker")
         else:
-            click.echo(f"❌ Error: Job '{job_id}' not found in Dead Letter Queue", err=True)
+            print(f"❌ Error: Job '{job_id}' not found in Dead Letter Queue", file=sys.stderr)
             sys.exit(1)
             
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@cli.group(name='config')
-def config_cmd():
-    """Manage configuration settings"""
-    pass
-
-
-@config_cmd.command()
-@click.argument('key')
-@click.argument('value')
-def set(key: str, value: str):
+def config_set(key: str, value: str):
     """
     Set a configuration value.
     
@@ -408,6 +577,7 @@ def set(key: str, value: str):
     - backoff-base: Base for exponential backoff calculation (float)
     - job-timeout: Job execution timeout in seconds (integer)
     - poll-interval: Worker polling interval in seconds (integer)
+    - batch-size: Jobs a worker claims per poll, up to 8 (integer)
     - worker-shutdown-timeout: Worker graceful shutdown timeout (integer)
     
     Example:
@@ -423,71 +593,95 @@ def set(key: str, value: str):
         queuectl config set worker-shutdown-timeout 15
     """
     try:
-        valid_keys = [
-            'max-retries', 
-            'backoff-base', 
-            'job-timeout',
-            'poll-interval',
-            'worker-shutdown-timeout'
-        ]
-        
-        if key not in valid_keys:
-            click.echo(f"❌ Error: Invalid configuration key '{key}'", err=True)
-            click.echo(f"   Valid keys: {', '.join(valid_keys)}", err=True)
+        if key not in CONFIG_KEYS:
+            print(f"❌ Error: Invalid configuration key '{key}'", file=sys.stderr)
+            print(f"   Valid keys: {', '.join(CONFIG_KEYS)}", file=sys.stderr)
             sys.exit(1)
         
-        # Convert key format (kebab-case to snake_case)
-        config_key = key.replace('-', '_')
-        
-        # Convert value to appropriate type
+        # Map to the snake_case config key, then convert and validate the value
         try:
-            if config_key in ['max_retries', 'job_timeout', 'poll_interval', 'worker_shutdown_timeout']:
-                value = int(value)
-                if value < 0:
-                    raise ValueError("Value must be non-negative")
-                if config_key == 'poll_interval' and value < 1:
-                    raise ValueError("Poll interval must be at least 1 second")
-            elif config_key == 'backoff_base':
-                value = float(value)
-                if value <= 0:
-                    raise ValueError("Value must be positive")
+            config_key, value = _parse_config_setting(key, value)
         except ValueError as e:
-            click.echo(f"❌ Error: Invalid value for '{key}': {str(e)}", err=True)
+            print(f"❌ Error: Invalid value for '{key}': {str(e)}", file=sys.stderr)
             sys.exit(1)
         
         # Save configuration
-        config.set(config_key, value)
-        click.echo(f"✓ Configuration updated")
-        click.echo(f"  {key} = {value}")
+        _config().set(config_key, value)
+        print(f"✓ Configuration updated")
+        print(f"  {key} = {value}")
         
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@config_cmd.command()
-def show():
+def config_set_many(settings: List[str]):
+    """
+    Set several configuration values at once.
+    
+    All settings are validated first and the configuration file is
+    written only once. Accepts the same keys as 'config set'.
+    
+    Example:
+    
+        queuectl config set-many max-retries=5 backoff-base=1.5 job-timeout=600
+    """
+    try:
+        updates = []
+        for setting in settings:
+            key, sep, value = setting.partition('=')
+            if not sep:
+                print(f"❌ Error: Expected KEY=VALUE, got '{setting}'", file=sys.stderr)
+                sys.exit(1)
+            
+            if key not in CONFIG_KEYS:
+                print(f"❌ Error: Invalid configuration key '{key}'", file=sys.stderr)
+                print(f"   Valid keys: {', '.join(CONFIG_KEYS)}", file=sys.stderr)
+                sys.exit(1)
+            
+            try:
+                updates.append((key, *_parse_config_setting(key, value)))
+            except ValueError as e:
+                print(f"❌ Error: Invalid value for '{key}': {str(e)}", file=sys.stderr)
+                sys.exit(1)
+        
+        # Apply in memory, then write the file once
+        config = _config()
+        for _, config_key, value in updates:
+            config.set(config_key, value)
+        config.flush()
+        
+        print(f"✓ Configuration updated")
+        for key, _, value in updates:
+            print(f"  {key} = {value}")
+        
+    except Exception as e:
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def config_show():
     """
     Show current configuration.
     
     Displays all configuration values and their current settings.
     """
     try:
-        click.echo("\n⚙️  Current Configuration:")
-        click.echo("─" * 40)
-        click.echo(f"  max-retries:   {config.get('max_retries')}")
-        click.echo(f"  backoff-base:  {config.get('backoff_base')}")
-        click.echo(f"  job-timeout:   {config.get('job_timeout')}s")
-        click.echo(f"  poll-interval: {config.get('poll_interval')}s")
-        click.echo("─" * 40)
+        print("\n⚙️  Current Configuration:")
+        print("─" * 40)
+        print(f"  max-retries:   {_config().get('max_retries')}")
+        print(f"  backoff-base:  {_config().get('backoff_base')}")
+        print(f"  job-timeout:   {_config().get('job_timeout')}s")
+        print(f"  poll-interval: {_config().get('poll_interval')}s")
+        print(f"  batch-size:    {_config().get('batch_size')}")
+        print("─" * 40)
         
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-@config_cmd.command()
-def reset():
+def config_reset():
     """
     Reset configuration to default values.
     
@@ -497,16 +691,191 @@ def reset():
     - job-timeout: 300
     """
     try:
-        click.confirm('Are you sure you want to reset configuration to defaults?', abort=True)
-        config.reset()
-        click.echo("✓ Configuration reset to defaults")
+        if not _confirm('Are you sure you want to reset configuration to defaults?'):
+            print("Cancelled")
+            return
+        _config().reset()
+        print("✓ Configuration reset to defaults")
         
-    except click.Abort:
-        click.echo("Cancelled")
     except Exception as e:
-        click.echo(f"❌ Error: {str(e)}", err=True)
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
+def _confirm(prompt: str) -> bool:
+    """
+    Ask a yes/no question on the terminal
+    
+    Args:
+        prompt: Question to display
+        
+    Returns:
+        True if the user answered yes, False otherwise
+    """
+    try:
+        answer = input(f"{prompt} [y/N]: ")
+    except EOFError:
+        print()
+        return False
+    return answer.strip().lower() in ('y', 'yes')
+
+
+def _describe(func: Callable) -> str:
+    """Use a command's docstring as its --help description"""
+    return textwrap.dedent(func.__doc__ or '').strip()
+
+
+def _add_leaf(subparsers, name: str, func: Callable, help: str) -> argparse.ArgumentParser:
+    """Register a subcommand that dispatches to func"""
+    parser = subparsers.add_parser(
+        name,
+        help=help,
+        description=_describe(func),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.set_defaults(func=func, parser=parser)
+    return parser
+
+
+def _configure_add(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=add)
+    parser.add_argument('job_id')
+    parser.add_argument('command')
+    parser.add_argument('--max-retries', '-r', type=int, help='Maximum retry attempts')
+
+
+def _configure_enqueue(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=enqueue)
+    parser.add_argument('job_data', nargs='?')
+    parser.add_argument('--file', '-f', help='Read job data from file')
+    parser.add_argument('--id', '-i', help='Job ID (alternative to JSON)')
+    parser.add_argument('--command', '-c', help='Command to execute (alternative to JSON)')
+    parser.add_argument('--max-retries', '-r', type=int, help='Maximum retry attempts')
+
+
+def _configure_enqueue_batch(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=enqueue_batch)
+    parser.add_argument('file', help="JSON file containing an array of jobs ('-' for stdin)")
+
+
+def _configure_worker(parser: argparse.ArgumentParser):
+    subparsers = parser.add_subparsers(metavar='COMMAND')
+    start = _add_leaf(subparsers, 'start', worker_start, 'Start worker processes to execute jobs.')
+    start.add_argument('--count', '-c', type=int, default=1, help='Number of workers to start')
+    _add_leaf(subparsers, 'stop', worker_stop, 'Stop all running workers gracefully.')
+
+
+def _configure_status(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=status)
+    parser.add_argument('--json', dest='as_json', action='store_true', help='Output as JSON')
+
+
+def _configure_list(parser: argparse.ArgumentParser):
+    parser.set_defaults(func=list_jobs)
+    parser.add_argument('--state', '-s', help='Filter by state (pending, processing, completed, failed, dead)')
+    parser.add_argument('--limit', '-l', type=int, default=10, help='Maximum number of jobs to display')
+    parser.add_argument('--offset', '-o', type=int, default=0, help='Number of jobs to skip (for paging)')
+    parser.add_argument('--json', dest='as_json', action='store_true', help='Output as JSON')
+
+
+def _configure_dlq(parser: argparse.ArgumentParser):
+    subparsers = parser.add_subparsers(metavar='COMMAND')
+    dlq_list_parser = _add_leaf(subparsers, 'list', dlq_list, 'List jobs in the Dead Letter Queue.')
+    dlq_list_parser.add_argument('--limit', '-l', type=int, default=10, help='Maximum number of jobs to display')
+    dlq_list_parser.add_argument('--json', dest='as_json', action='store_true', help='Output as JSON')
+    retry = _add_leaf(subparsers, 'retry', dlq_retry, 'Retry a job from the Dead Letter Queue.')
+    retry.add_argument('job_id')
+
+
+def _configure_config(parser: argparse.ArgumentParser):
+    subparsers = parser.add_subparsers(metavar='COMMAND')
+    set_parser = _add_leaf(subparsers, 'set', config_set, 'Set a configuration value.')
+    set_parser.add_argument('key')
+    set_parser.add_argument('value')
+    set_many = _add_leaf(subparsers, 'set-many', config_set_many, 'Set several configuration values at once.')
+    set_many.add_argument('settings', nargs='+', metavar='KEY=VALUE')
+    _add_leaf(subparsers, 'show', config_show, 'Show current configuration.')
+    _add_leaf(subparsers, 'reset', config_reset, 'Reset configuration to default values.')
+
+
+# Top-level commands: name -> (help text, description source, configure function).
+# Only the invoked command's arguments are configured, the rest are
+# registered by name so they still show up in --help.
+COMMANDS: Dict[str, Tuple[str, Optional[Callable], Callable]] = {
+    'add': ('Quick way to add a job (no JSON needed).', add, _configure_add),
+    'enqueue': ('Enqueue a new job to the queue.', enqueue, _configure_enqueue),
+    'enqueue-batch': ('Enqueue many jobs at once from a JSON array.', enqueue_batch, _configure_enqueue_batch),
+    'worker': ('Manage worker processes', None, _configure_worker),
+    'status': ('Show system status and job statistics.', status, _configure_status),
+    'list': ('List jobs, optionally filtered by state.', list_jobs, _configure_list),
+    'dlq': ('Manage Dead Letter Queue (DLQ)', None, _configure_dlq),
+    'config': ('Manage configuration settings', None, _configure_config),
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser
+    
+    Args:
+        command: Top-level command being invoked; only its arguments
+            are configured. None configures none of them.
+            
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog='queuectl',
+        description=(
+            "QueueCTL - Background Job Queue System\n\n"
+            "A production-grade CLI tool for managing background jobs with\n"
+            "automatic retries, exponential backoff, and Dead Letter Queue."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--version', action='version', version='%(prog)s, version 1.0.0')
+    parser.set_defaults(func=None, parser=parser)
+    
+    subparsers = parser.add_subparsers(metavar='COMMAND')
+    for name, (help, func, configure) in COMMANDS.items():
+        subparser = subparsers.add_parser(
+            name,
+            help=help,
+            description=_describe(func) if func else help,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+        )
+        subparser.set_defaults(func=None, parser=subparser)
+        if name == command:
+            configure(subparser)
+    
+    return parser
+
+
+def cli(argv: Optional[List[str]] = None):
+    """
+    QueueCTL - Background Job Queue System
+    
+    Entry point: parses arguments and dispatches to the command handler.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = build_parser(argv[0] if argv else None)
+    args = vars(parser.parse_args(argv))
+    
+    func = args.pop('func')
+    command_parser = args.pop('parser')
+    
+    # Groups invoked without a subcommand just print their help
+    if func is None:
+        command_parser.print_help()
+        return
+    
+    func(**args)
+
+
 if __name__ == '__main__':
     cli()
\ No newline at end of file
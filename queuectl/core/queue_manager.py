@@ -2,33 +2,99 @@
 Queue manager - handles job lifecycle and queue operations
 """
 
-from typing import List, Optional
-from datetime import datetime
+import logging
+from typing import Any, Dict, List, Optional, Sequence
 
 from queuectl.models import Job, JobState
-from queuectl.storage import JobStorage
+from queuectl.storage import JobStorage, WriteBatcher
 from queuectl.utils import Config
 
 
+logger = logging.getLogger(__name__)
+
+
+def _check_job_id(job_id: Any):
+    """
+    Reject job IDs that are empty or only whitespace
+    
+    Raises:
+        ValueError: If the ID is blank
+    """
+    if not str(job_id).strip():
+        raise ValueError("Job ID must not be empty")
+
+
 class QueueManager:
     """
     Manages the job queue, including enqueuing, state transitions,
     retry logic, and Dead Letter Queue operations
     """
     
-    def __init__(self, config: Config, storage_path: str = "queuectl.db"):
+    def __init__(self, config: Config, storage_path: str = "queuectl.db", recover: bool = True):
         """
         Initialize queue manager
         
         Args:
             config: Configuration object
             storage_path: Path to SQLite database
+            recover: Reset jobs left in processing state by a previous run.
+                Pass False when workers may be running against the same database.
         """
         self.config = config
         self.storage = JobStorage(storage_path)
+        self.invalidate()
+        
+        # Job completions/failures are written in batches; created on first use
+        self._batcher: Optional[WriteBatcher] = None
+        
+        # get_stats() cache: refetched when _data_version moves past
+        # the version the cached stats were computed at
+        self._stats_cache = None
+        self._stats_version = -1
+        self._data_version = 0
         
         # Reset any jobs stuck in processing state on startup
+        if recover:
+            self.recover_processing_jobs()
+    
+    def recover_processing_jobs(self):
+        """
+        Move jobs stuck in processing state (e.g. after a crash) back to pending
+        
+        Only safe when no worker is running against the same database.
+        """
         self.storage.reset_processing_jobs()
+        self._mark_dirty()
+    
+    def invalidate(self):
+        """
+        Refresh cached configuration values
+        
+        Call after changing the configuration this manager was created with.
+        """
+        self._backoff_base = self.config.get('backoff_base')
+        self._default_max_retries = self.config.get('max_retries')
+    
+    def _mark_dirty(self):
+        """Record that job data changed, invalidating cached stats"""
+        self._data_version += 1
+    
+    def _save_batched(self, job: Job):
+        """Queue a job save on the write batcher"""
+        if self._batcher is None:
+            self._batcher = WriteBatcher(self.storage)
+        self._batcher.enqueue(job)
+    
+    def _sync(self):
+        """Write out batched saves so storage reflects every change made here"""
+        if self._batcher is not None:
+            self._batcher.flush()
+    
+    def close(self):
+        """Write out batched saves, stop the write batcher and close storage"""
+        if self._batcher is not None:
+            self._batcher.close()
+        self.storage.close()
     
     def enqueue(self, job_id: str, command: str, max_retries: Optional[int] = None) -> Job:
         """
@@ -43,10 +109,12 @@ class QueueManager:
             Created Job object
             
         Raises:
-            ValueError: If job with same ID already exists
+            ValueError: If the job ID is empty or a job with the same ID already exists
         """
+        _check_job_id(job_id)
+        
         if max_retries is None:
-            max_retries = self.config.get('max_retries')
+            max_retries = self._default_max_retries
         
         # Check if job already exists
         existing = self.storage.get_job(job_id)
@@ -62,29 +130,101 @@ class QueueManager:
         
         # Persist to storage
         self.storage.save_job(job)
+        self._mark_dirty()
         return job
     
+    def enqueue_many(self, specs: List[Dict[str, Any]]) -> List[Job]:
+        """
+        Enqueue several jobs in a single transaction
+        
+        Args:
+            specs: Job specifications, each a dict with 'id', 'command'
+                and optionally 'max_retries'
+        
+        Returns:
+            List of created Job objects
+            
+        Raises:
+            ValueError: If a spec is invalid, or a job ID is empty, duplicated
+                or already exists (no job is enqueued)
+            RuntimeError: If the jobs could not be written (no job is enqueued)
+        """
+        jobs = []
+        seen = set()
+        
+        for spec in specs:
+            if not isinstance(spec, dict):
+                raise ValueError("Each job must be a JSON object")
+            if 'id' not in spec:
+                raise ValueError("Job must contain 'id' field")
+            _check_job_id(spec['id'])
+            if 'command' not in spec:
+                raise ValueError(f"Job '{spec['id']}' must contain 'command' field")
+            if spec['id'] in seen:
+                raise ValueError(f"Job ID '{spec['id']}' appears more than once")
+            seen.add(spec['id'])
+            
+            jobs.append(Job(
+                id=spec['id'],
+                command=spec['command'],
+                max_retries=spec.get('max_retries', self._default_max_retries)
+            ))
+        
+        # Check all IDs against storage with one query
+        existing = self.storage.get_existing_ids(seen)
+        if existing:
+            raise ValueError(f"Jobs with IDs already exist: {', '.join(sorted(existing))}")
+        
+        # Persist all jobs in one transaction
+        if not self.storage.save_jobs(jobs):
+            raise RuntimeError("Failed to save jobs to the database")
+        self._mark_dirty()
+        return jobs
+    
     def get_next_job(self) -> Optional[Job]:
         """
         Get the next job to process
         
-        Checks for:
-        1. Retryable failed jobs (past their retry time)
-        2. Pending jobs
+        Retryable failed jobs (past their retry time) are moved back to
+        pending, then the oldest pending job is claimed, all in one
+        atomic storage operation.
         
         Returns:
             Job object or None if no jobs available
         """
-        # First check for retryable failed jobs
-        retryable = self.storage.get_retryable_jobs()
-        if retryable:
-            job = retryable[0]
-            # Move back to pending for retry
-            job.update_state(JobState.PENDING)
-            self.storage.save_job(job)
+        job = self.storage.claim_next_job()
+        if job:
+            self._mark_dirty()
+        return job
+    
+    def get_next_jobs(self, limit: int) -> List[Job]:
+        """
+        Claim up to limit jobs to process, oldest first
+        
+        Like get_next_job(), but one storage round-trip claims the whole
+        batch. Jobs the caller doesn't run must be handed back with
+        release_jobs().
         
-        # Get next pending job (atomic operation)
-        return self.storage.get_next_pending_job()
+        Args:
+            limit: Maximum number of jobs to claim
+        
+        Returns:
+            List of Job objects (empty if no jobs available)
+        """
+        jobs = self.storage.claim_jobs(limit)
+        if jobs:
+            self._mark_dirty()
+        return jobs
+    
+    def release_jobs(self, jobs: List[Job]):
+        """
+        Return claimed but unstarted jobs to the queue
+        
+        Args:
+            jobs: Jobs obtained from get_next_jobs() that won't be run
+        """
+        if self.storage.release_jobs([job.id for job in jobs]):
+            self._mark_dirty()
     
     def mark_completed(self, job: Job):
         """
@@ -94,7 +234,8 @@ class QueueManager:
             job: Job that completed successfully
         """
         job.update_state(JobState.COMPLETED)
-        self.storage.save_job(job)
+        self._save_batched(job)
+        self._mark_dirty()
     
     def mark_failed(self, job: Job, error_message: str):
         """
@@ -112,14 +253,15 @@ class QueueManager:
         if job.should_retry():
             # Schedule for retry with exponential backoff
             job.update_state(JobState.FAILED, error_message)
-            job.set_next_retry(self.config.get('backoff_base'))
-            print(f"Job {job.id} will retry in {job.calculate_retry_delay(self.config.get('backoff_base')):.1f} seconds")
+            delay = job.set_next_retry(self._backoff_base)
+            logger.info("Job %s will retry in %.1f seconds", job.id, delay)
         else:
             # Move to DLQ - no more retries
             job.update_state(JobState.DEAD, error_message)
-            print(f"Job {job.id} moved to Dead Letter Queue after {job.attempts} attempts")
+            logger.info("Job %s moved to Dead Letter Queue after %d attempts", job.id, job.attempts)
         
-        self.storage.save_job(job)
+        self._save_batched(job)
+        self._mark_dirty()
     
     def get_job(self, job_id: str) -> Optional[Job]:
         """
@@ -131,6 +273,7 @@ class QueueManager:
         Returns:
             Job object if found, None otherwise
         """
+        self._sync()
         return self.storage.get_job(job_id)
     
     def list_jobs(self, state: Optional[str] = None, limit: int = 100) -> List[Job]:
@@ -144,16 +287,48 @@ class QueueManager:
         Returns:
             List of Job objects
         """
+        self._sync()
         return self.storage.list_jobs(state, limit)
     
+    def list_jobs_summary(
+        self,
+        state: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[tuple]:
+        """
+        List selected job columns as tuples, for display
+        
+        Args:
+            state: Filter by job state (optional)
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip
+            columns: Columns to select (storage default if None)
+            
+        Returns:
+            List of tuples with the requested columns
+        """
+        self._sync()
+        if columns is None:
+            return self.storage.list_jobs_summary(state, limit, offset)
+        return self.storage.list_jobs_summary(state, limit, offset, columns)
+    
     def get_stats(self) -> dict:
         """
         Get job statistics
         
+        Results are cached until a job is changed through this manager.
+        Changes made by other processes are not seen until then.
+        
         Returns:
             Dictionary with counts for each state
         """
-        return self.storage.get_stats()
+        if self._stats_version != self._data_version:
+            self._sync()
+            self._stats_cache = self.storage.get_stats()
+            self._stats_version = self._data_version
+        return dict(self._stats_cache)
     
     def retry_dlq_job(self, job_id: str) -> bool:
         """
@@ -167,18 +342,11 @@ class QueueManager:
         Returns:
             True if job was found and moved, False otherwise
         """
-        job = self.storage.get_job(job_id)
-        
-        if not job or job.state != JobState.DEAD:
+        self._sync()
+        if not self.storage.retry_dlq(job_id):
             return False
         
-        # Reset job for retry
-        job.attempts = 0
-        job.update_state(JobState.PENDING)
-        job.next_retry_at = None
-        job.error_message = None
-        
-        self.storage.save_job(job)
+        self._mark_dirty()
         return True
     
     def delete_job(self, job_id: str) -> bool:
@@ -191,7 +359,10 @@ class QueueManager:
         Returns:
             True if job was deleted, False otherwise
         """
-        return self.storage.delete_job(job_id)
+        self._sync()
+        deleted = self.storage.delete_job(job_id)
+        self._mark_dirty()
+        return deleted
     
     def cleanup_old_jobs(self, days: int = 30) -> int:
         """
@@ -203,4 +374,7 @@ class QueueManager:
         Returns:
             Number of jobs deleted
         """
-        return self.storage.cleanup_old_jobs(days)
\ No newline at end of file
+        self._sync()
+        deleted = self.storage.cleanup_old_jobs(days)
+        self._mark_dirty()
+        return deleted
\ No newline at end of file
@@ -2,10 +2,18 @@
 Worker process management and job execution
 """
 
+import functools
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import shlex
+import shutil
 import subprocess
-import time
 import threading
-from typing import List
+import time
+from collections import deque
+from typing import List, Optional, Tuple
 import signal
 import sys
 
@@ -14,13 +22,168 @@ from queuectl.utils import Config
 from queuectl.models import Job
 
 
+logger = logging.getLogger(__name__)
+
+
+# Seconds a worker gets to abort its job and release its claims after the
+# shutdown timeout, before it is killed
+ABORT_GRACE = 2
+
+# Upper bound on jobs a worker claims at once; claimed jobs wait in that
+# worker even while its siblings are idle
+MAX_CLAIM_BATCH = 8
+
+# Characters /bin/sh gives a meaning beyond splitting words and quoting;
+# commands containing any of them always run through the shell
+_SHELL_CHARS = frozenset('|&;<>()$`\\*?[]#~={}!\n')
+
+
+@functools.lru_cache(maxsize=256)
+def _find_executable(name: str) -> Optional[str]:
+    """Look up a program on PATH, caching results for the worker's lifetime"""
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _direct_command(command: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """
+    Split a command that can run without a shell
+    
+    Launching the program directly skips starting /bin/sh for every job.
+    Results are cached, so retries and repeated commands are tokenized
+    and looked up on PATH only once per worker process.
+    
+    Args:
+        command: Shell command of a job
+        
+    Returns:
+        Tuple of (executable path, argv tuple), or None if the command needs a
+        shell (shell syntax, builtins such as exit, or Windows)
+    """
+    if sys.platform == 'win32' or not _SHELL_CHARS.isdisjoint(command):
+        return None
+    
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv:
+        return None
+    
+    executable = _find_executable(argv[0])
+    if executable is None:
+        return None
+    return executable, tuple(argv)
+
+
+def _new_wakeup():
+    """
+    Create the wake-up token idle workers wait on between polls
+    
+    A semaphore holding at most one token. Releasing it never waits on the
+    workers it wakes (unlike notifying a Condition), so a worker that dies
+    while waiting can't block its siblings or shutdown.
+    """
+    wakeup = multiprocessing.BoundedSemaphore(1)
+    wakeup.acquire()
+    return wakeup
+
+
+class _UnflushedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to _BatchingQueueListener"""
+    
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers once the queue is drained"""
+    
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+def _start_logging() -> logging.handlers.QueueListener:
+    """
+    Route this process's log records through a background writer thread
+    
+    The worker loop only enqueues records; the listener thread writes
+    them to stdout and flushes once per burst instead of once per line.
+    
+    Returns:
+        Started listener (stop it before exiting to write remaining records)
+    """
+    records = queue.SimpleQueue()
+    handler = _UnflushedStreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(records)]
+    root.setLevel(logging.INFO)
+    
+    listener = _BatchingQueueListener(records, handler)
+    listener.start()
+    return listener
+
+
+def _worker_main(worker_id: int, storage_path: str, config_file: str,
+                 stop_event, busy, wakeup, abort):
+    """
+    Entry point of a worker process
+    
+    Builds its own configuration, queue manager and database connection,
+    then runs the worker loop until stop_event is set.
+    
+    Args:
+        worker_id: Unique identifier for this worker
+        storage_path: Path to SQLite database
+        config_file: Path to configuration file
+        stop_event: Shared event set by the parent to request shutdown
+        busy: Shared flag the worker sets while processing a job
+        wakeup: Shared wake-up token idle workers wait on between polls
+        abort: Shared flag the parent sets before a SIGTERM that must abort
+    """
+    # The parent coordinates shutdown, so ignore Ctrl+C sent to the whole
+    # process group
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    listener = _start_logging()
+    
+    config = Config(config_file)
+    # Jobs in processing belong to sibling workers, so don't reset them
+    queue_manager = QueueManager(config, storage_path, recover=False)
+    
+    worker = Worker(worker_id, queue_manager, config, stop_event, busy, wakeup, abort)
+    
+    # SIGTERM (also sent to the whole group by tools like `timeout`) lets the
+    # current job finish, unless the parent flagged it as an abort. The
+    # handler only reads lock-free flags: touching the shared event here
+    # could deadlock on its lock.
+    signal.signal(signal.SIGTERM, worker._handle_sigterm)
+    
+    try:
+        worker._run()
+    finally:
+        # atexit doesn't run in multiprocessing children; write batched saves
+        # and pending log records now
+        queue_manager.close()
+        listener.stop()
+        sys.stdout.flush()
+
+
 class Worker:
     """
     Single worker that processes jobs from the queue
-    Runs in a separate thread and executes shell commands
+    Runs in a separate process and executes shell commands
     """
     
-    def __init__(self, worker_id: int, queue_manager: QueueManager, config: Config):
+    def __init__(self, worker_id: int, queue_manager: QueueManager, config: Config,
+                 stop_event=None, busy=None, wakeup=None, abort=None):
         """
         Initialize worker
         
@@ -28,59 +191,187 @@ class Worker:
             worker_id: Unique identifier for this worker
             queue_manager: Queue manager instance
             config: Configuration object
+            stop_event: Shared stop event (created if None)
+            busy: Shared busy flag (created if None)
+            wakeup: Shared wake-up token (created if None)
+            abort: Shared abort flag (created if None)
         """
         self.worker_id = worker_id
         self.queue_manager = queue_manager
         self.config = config
-        self.running = False
-        self.thread = None
+        self.process = None
         self.current_job = None
+        self._terminated = False
+        # Jobs claimed from the queue but not started yet
+        self._claimed = deque()
+        
+        # Shared between this handle and the worker process. The busy flag
+        # is lock-free so a worker killed mid-update can't wedge the parent.
+        self._stop_event = stop_event if stop_event is not None else multiprocessing.Event()
+        self._busy = busy if busy is not None else multiprocessing.Value('b', False, lock=False)
+        # Set by terminate() so the worker's SIGTERM handler aborts the job
+        self._abort = abort if abort is not None else multiprocessing.Value('b', False, lock=False)
+        # Released when there may be work or the workers should stop, so idle
+        # workers don't have to wait out a full poll interval
+        self._wakeup = wakeup if wakeup is not None else _new_wakeup()
+        
+        # Settings are read once: a worker process loads its own Config at
+        # start-up, so later `config set` changes apply to workers started
+        # after them
+        self._poll_interval = self.config.get('poll_interval', 1)
+        self._job_timeout = self.config.get('job_timeout', 300)
+        self._batch_size = min(MAX_CLAIM_BATCH, self.config.get('batch_size', 1))
+    
+    @property
+    def running(self) -> bool:
+        """True while the worker process is alive and not asked to stop"""
+        return (
+            self.process is not None
+            and self.process.is_alive()
+            and not self._stop_event.is_set()
+        )
     
     def start(self):
-        """Start the worker thread"""
-        self.running = True
-        self.thread = threading.Thread(target=self._run, daemon=True)
-        self.thread.start()
+        """Start the worker process"""
+        self.process = multiprocessing.Process(
+            target=_worker_main,
+            args=(
+                self.worker_id,
+                self.queue_manager.storage.db_path,
+                str(self.config.config_file),
+                self._stop_event,
+                self._busy,
+                self._wakeup,
+                self._abort,
+            ),
+            name=f"Worker-{self.worker_id}",
+            daemon=True,
+        )
+        self.process.start()
     
     def stop(self):
         """Stop the worker gracefully"""
-        self.running = False
+        self._stop_event.set()
+        self._notify()
     
     def join(self, timeout=None):
         """
-        Wait for worker thread to finish
+        Wait for worker process to finish
         
         Args:
             timeout: Maximum time to wait in seconds
         """
-        if self.thread:
-            self.thread.join(timeout)
+        if self.process:
+            self.process.join(timeout)
+    
+    def is_alive(self) -> bool:
+        """True while the worker process exists, whether or not it was asked to stop"""
+        return self.process is not None and self.process.is_alive()
+    
+    def terminate(self):
+        """Make the worker process abort its current job and exit"""
+        self._abort.value = True
+        if self.process:
+            self.process.terminate()
+    
+    def kill(self):
+        """Stop the worker process immediately, abandoning its current job"""
+        if self.process:
+            self.process.kill()
+            self.process.join()
+    
+    def _handle_sigterm(self, signum, frame):
+        """
+        Handle SIGTERM in the worker process
+        
+        The first SIGTERM stops the worker after its current job. One sent
+        by terminate(), or a second one, aborts now: the exception kills the
+        running command and _run() hands the job back to the queue.
+        """
+        if self._abort.value or self._terminated:
+            raise SystemExit(1)
+        self._terminated = True
     
     def _run(self):
         """
         Main worker loop
         Continuously polls for jobs and executes them
         """
-        print(f"[Worker-{self.worker_id}] Started")
-        while self.running:
+        logger.info("[Worker-%d] Started", self.worker_id)
+        try:
+            self._process_jobs()
+        except SystemExit:
+            logger.info("[Worker-%d] Aborted", self.worker_id)
+            if self.current_job is not None:
+                # Its command was killed mid-run; let it run again
+                self._claimed.appendleft(self.current_job)
+            raise
+        finally:
+            # Hand back claimed jobs this worker won't get to
+            if self._claimed:
+                self.queue_manager.release_jobs(list(self._claimed))
+                self._claimed.clear()
+            # Pass the wake-up on, so a stop reaches every idle sibling
+            self._notify()
+        
+        logger.info("[Worker-%d] Stopped", self.worker_id)
+    
+    def _process_jobs(self):
+        """Claim and execute jobs until asked to stop"""
+        while not self._terminated and not self._stop_event.is_set():
             try:
                 # Get next job
-                job = self.queue_manager.get_next_job()
+                job = self._next_job()
                 
                 if job:
+                    # The queue may hold more; let an idle sibling check now
+                    self._notify()
+                    
                     self.current_job = job
-                    print(f"[Worker-{self.worker_id}] Processing job: {job.id}")
+                    self._busy.value = True
+                    logger.info("[Worker-%d] Processing job: %s", self.worker_id, job.id)
                     self._execute_job(job)
                     self.current_job = None
+                    self._busy.value = False
                 else:
-                    # No jobs available, sleep briefly
-                    time.sleep(self.config.get('poll_interval', 1))
+                    # No jobs available; wait for a sibling's wake-up or stop.
+                    # The timeout picks up external enqueues and due retries.
+                    self._wait_for_work(self._poll_interval)
                     
             except Exception as e:
-                print(f"[Worker-{self.worker_id}] Error: {e}")
-                time.sleep(self.config.get('poll_interval', 1))
+                logger.error("[Worker-%d] Error: %s", self.worker_id, e)
+                self.current_job = None
+                self._busy.value = False
+                self._stop_event.wait(self._poll_interval)
+    
+    def _next_job(self) -> Optional[Job]:
+        """
+        Take the next claimed job, claiming a new batch when none are left
+        
+        Returns:
+            Job to process, or None if the queue is empty
+        """
+        if not self._claimed:
+            self._claimed.extend(self.queue_manager.get_next_jobs(self._batch_size))
+        return self._claimed.popleft() if self._claimed else None
+    
+    def _notify(self):
+        """Wake one idle worker, unless a wake-up is already pending"""
+        try:
+            self._wakeup.release()
+        except ValueError:
+            # The token hasn't been taken yet; one wake-up is enough
+            pass
+    
+    def _wait_for_work(self, timeout: float):
+        """
+        Sleep until woken for possible work, asked to stop, or timed out
         
-        print(f"[Worker-{self.worker_id}] Stopped")
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        if not self._stop_event.is_set():
+            self._wakeup.acquire(timeout=timeout)
     
     def _execute_job(self, job: Job):
         """
@@ -93,45 +384,60 @@ class Worker:
             job: Job to execute
         """
         try:
-            # Get timeout from config (default 300 seconds = 5 minutes)
-            timeout = self.config.get('job_timeout', 300)
+            # Cached from config (default 300 seconds = 5 minutes)
+            timeout = self._job_timeout
             
-            # Execute command using shell
-            result = subprocess.run(
-                job.command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            direct = _direct_command(job.command)
+            if direct is not None:
+                # Plain program invocation: no need for a shell
+                executable, argv = direct
+                result = subprocess.run(
+                    argv,
+                    executable=executable,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+                if result.returncode < 0:
+                    # Killed by a signal: report 128+N like /bin/sh, not -N
+                    result.returncode = 128 - result.returncode
+            else:
+                # Execute command using shell
+                result = subprocess.run(
+                    job.command,
+                    shell=True,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
             
             # Check exit code
             if result.returncode == 0:
-                print(f"[Worker-{self.worker_id}] ✓ Job {job.id} completed successfully")
+                logger.info("[Worker-%d] ✓ Job %s completed successfully", self.worker_id, job.id)
                 if result.stdout:
-                    print(f"[Worker-{self.worker_id}]   Output: {result.stdout.strip()[:100]}")
+                    logger.info("[Worker-%d]   Output: %s", self.worker_id, result.stdout.strip()[:100])
                 self.queue_manager.mark_completed(job)
             else:
                 error_msg = f"Command exited with code {result.returncode}"
                 if result.stderr:
                     error_msg += f": {result.stderr[:200]}"
                 
-                print(f"[Worker-{self.worker_id}] ✗ Job {job.id} failed: {error_msg}")
+                logger.info("[Worker-%d] ✗ Job %s failed: %s", self.worker_id, job.id, error_msg)
                 self.queue_manager.mark_failed(job, error_msg)
                 
         except subprocess.TimeoutExpired:
             error_msg = f"Command timed out after {timeout} seconds"
-            print(f"[Worker-{self.worker_id}] ⏱ Job {job.id} timed out")
+            logger.info("[Worker-%d] ⏱ Job %s timed out", self.worker_id, job.id)
             self.queue_manager.mark_failed(job, error_msg)
             
         except FileNotFoundError:
             error_msg = "Command not found"
-            print(f"[Worker-{self.worker_id}] ✗ Job {job.id} failed: {error_msg}")
+            logger.info("[Worker-%d] ✗ Job %s failed: %s", self.worker_id, job.id, error_msg)
             self.queue_manager.mark_failed(job, error_msg)
             
         except Exception as e:
             error_msg = f"Execution error: {str(e)}"
-            print(f"[Worker-{self.worker_id}] ✗ Job {job.id} error: {error_msg}")
+            logger.info("[Worker-%d] ✗ Job %s error: %s", self.worker_id, job.id, error_msg)
             self.queue_manager.mark_failed(job, error_msg)
     
     def is_busy(self) -> bool:
@@ -141,7 +447,7 @@ class Worker:
         Returns:
             True if processing, False otherwise
         """
-        return self.current_job is not None
+        return bool(self._busy.value)
 
 
 class WorkerManager:
@@ -163,9 +469,17 @@ class WorkerManager:
         self.workers: List[Worker] = []
         self.shutdown_event = threading.Event()
         
-        # Register signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Register signal handlers for graceful shutdown, keeping the
+        # previous ones for restore_signal_handlers()
+        self._previous_handlers = {
+            signum: signal.signal(signum, self._signal_handler)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+    
+    def restore_signal_handlers(self):
+        """Reinstate the signal handlers that were set before this manager"""
+        for signum, handler in self._previous_handlers.items():
+            signal.signal(signum, handler)
     
     def _signal_handler(self, signum, frame):
         """
@@ -186,15 +500,29 @@ class WorkerManager:
         Args:
             count: Number of workers to start
         """
+        # Forked workers inherit unflushed output; flush it so it isn't duplicated
+        sys.stdout.flush()
+        sys.stderr.flush()
+        
+        # An open SQLite connection must not be carried across fork(): write
+        # out batched saves and close ours (workers open their own). The
+        # parent reconnects if it touches storage again.
+        self.queue_manager.close()
+        
+        # One wake-up token shared by all workers, so a worker that claims a
+        # job can hand the next one to an idle sibling
+        wakeup = _new_wakeup()
+        
         for i in range(count):
-            worker = Worker(i + 1, self.queue_manager, self.config)
+            worker = Worker(i + 1, self.queue_manager, self.config, wakeup=wakeup)
             worker.start()
             self.workers.append(worker)
     
     def stop_workers(self):
         """
         Stop all workers gracefully
-        Waits for current jobs to complete (up to 10 seconds per worker)
+        Waits for current jobs to complete (up to worker_shutdown_timeout
+        seconds, 10 by default), then kills workers that are still running
         """
         if not self.workers:
             return
@@ -205,19 +533,42 @@ class WorkerManager:
         for worker in self.workers:
             worker.stop()
         
-        # Wait for all workers to finish current job
+        # Wait for all workers to finish current job. They stop concurrently,
+        # so they share one deadline.
+        deadline = time.monotonic() + self.config.get('worker_shutdown_timeout', 10)
         for worker in self.workers:
             if worker.is_busy():
                 print(f"   Waiting for Worker-{worker.worker_id} to finish current job...")
-            worker.join(timeout=self.config.get('worker_shutdown_timeout', 10))
+            worker.join(timeout=max(0, deadline - time.monotonic()))
+        
+        # Out of time: abort the remaining jobs (the workers release them),
+        # then kill any worker that still hasn't exited. Nothing is left for
+        # interpreter exit to reap.
+        stopped = [worker for worker in self.workers if worker.is_alive()]
+        for worker in stopped:
+            worker.terminate()
+        deadline = time.monotonic() + ABORT_GRACE
+        for worker in stopped:
+            worker.join(timeout=max(0, deadline - time.monotonic()))
+            if worker.is_alive():
+                worker.kill()
         
         self.workers.clear()
         self.shutdown_event.set()
-        print("✓ All workers stopped")
+        if stopped:
+            names = ", ".join(f"Worker-{worker.worker_id}" for worker in stopped)
+            print(f"⚠ Shutdown timeout reached; force-stopped {names}")
+        else:
+            print("✓ All workers stopped")
     
     def wait(self):
         """Wait for shutdown signal"""
-        self.shutdown_event.wait()
+        if sys.platform == 'win32':
+            # Ctrl+C can't interrupt a blocking wait on Windows
+            while not self.shutdown_event.wait(1):
+                pass
+        else:
+            self.shutdown_event.wait()
     
     def get_active_count(self) -> int:
         """
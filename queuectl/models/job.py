@@ -2,11 +2,17 @@
 Job model and related classes
 """
 
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import time
 from typing import Optional
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from queuectl.utils.clock import utc_iso
+
 
 class JobState:
     """Job state constants"""
@@ -17,7 +23,6 @@ class JobState:
     DEAD = "dead"
 
 
-@dataclass
 class Job:
     """
     Represents a background job in the queue system
@@ -33,31 +38,72 @@ class Job:
         next_retry_at: Timestamp for next retry (if failed)
         error_message: Last error message (if failed)
     """
-    id: str
-    command: str
-    state: str = JobState.PENDING
-    attempts: int = 0
-    max_retries: int = 3
-    created_at: str = None
-    updated_at: str = None
-    next_retry_at: Optional[str] = None
-    error_message: Optional[str] = None
+    # Slots instead of a per-instance __dict__: jobs are created per row
+    __slots__ = (
+        'id', 'command', 'state', 'attempts', 'max_retries',
+        'created_at', 'updated_at', 'next_retry_at', 'error_message'
+    )
+    
+    def __init__(
+        self,
+        id: str,
+        command: str,
+        state: str = JobState.PENDING,
+        attempts: int = 0,
+        max_retries: int = 3,
+        created_at: Optional[str] = None,
+        updated_at: Optional[str] = None,
+        next_retry_at: Optional[str] = None,
+        error_message: Optional[str] = None
+    ):
+        """Initialize job, filling in timestamps if not provided"""
+        if created_at is None or updated_at is None:
+            now = utc_iso()
+            if created_at is None:
+                created_at = now
+            if updated_at is None:
+                updated_at = now
+        
+        self.id = id
+        self.command = command
+        self.state = state
+        self.attempts = attempts
+        self.max_retries = max_retries
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.next_retry_at = next_retry_at
+        self.error_message = error_message
     
-    def __post_init__(self):
-        """Initialize timestamps if not provided"""
-        now = datetime.utcnow().isoformat() + "Z"
-        if self.created_at is None:
-            self.created_at = now
-        if self.updated_at is None:
-            self.updated_at = now
+    def __eq__(self, other) -> bool:
+        """Jobs are equal when all their fields are equal"""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
     
     def to_dict(self) -> dict:
         """Convert job to dictionary"""
-        return asdict(self)
+        # Spelled out rather than built from __slots__: no getattr per field
+        return {
+            'id': self.id,
+            'command': self.command,
+            'state': self.state,
+            'attempts': self.attempts,
+            'max_retries': self.max_retries,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'next_retry_at': self.next_retry_at,
+            'error_message': self.error_message,
+        }
     
     def to_json(self) -> str:
-        """Convert job to JSON string"""
-        return json.dumps(self.to_dict(), indent=2)
+        """Convert job to compact JSON string, using orjson when installed"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode()
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'))
+    
+    def to_pretty_json(self) -> str:
+        """Convert job to indented JSON string, for display"""
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Job':
@@ -67,6 +113,8 @@ class Job:
     @classmethod
     def from_json(cls, json_str: str) -> 'Job':
         """Create job from JSON string"""
+        if orjson is not None:
+            return cls.from_dict(orjson.loads(json_str))
         return cls.from_dict(json.loads(json_str))
     
     def update_state(self, new_state: str, error_message: Optional[str] = None):
@@ -78,14 +126,14 @@ class Job:
             error_message: Optional error message if failed
         """
         self.state = new_state
-        self.updated_at = datetime.utcnow().isoformat() + "Z"
+        self.updated_at = utc_iso()
         if error_message:
             self.error_message = error_message
     
     def increment_attempts(self):
         """Increment attempt counter and update timestamp"""
         self.attempts += 1
-        self.updated_at = datetime.utcnow().isoformat() + "Z"
+        self.updated_at = utc_iso()
     
     def should_retry(self) -> bool:
         """
@@ -109,16 +157,19 @@ class Job:
         """
         return backoff_base ** self.attempts
     
-    def set_next_retry(self, backoff_base: float = 2.0):
+    def set_next_retry(self, backoff_base: float = 2.0) -> float:
         """
         Calculate and set next retry timestamp
         
         Args:
             backoff_base: Base for exponential backoff calculation
+            
+        Returns:
+            Delay until the next retry in seconds
         """
         delay = self.calculate_retry_delay(backoff_base)
-        next_time = datetime.utcnow().timestamp() + delay
-        self.next_retry_at = datetime.fromtimestamp(next_time).isoformat() + "Z"
+        self.next_retry_at = utc_iso(time.time() + delay)
+        return delay
     
     def __str__(self) -> str:
         """String representation of job"""
@@ -3,5 +3,6 @@ Storage package
 """
 
 from .database import JobStorage
+from .batcher import WriteBatcher
 
-__all__ = ['JobStorage']
\ No newline at end of file
+__all__ = ['JobStorage', 'WriteBatcher']
\ No newline at end of file
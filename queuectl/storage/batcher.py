@@ -0,0 +1,146 @@
+"""
+Write batching for job updates
+Coalesces individual job saves into batched SQLite transactions
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from queuectl.models import Job
+
+
+logger = logging.getLogger(__name__)
+
+# Queued after the last job to tell the flusher thread to exit
+_STOP = object()
+
+# Extra attempts at writing a batch that failed (e.g. database locked by
+# another writer), and the delay before the first, doubling after each
+WRITE_RETRIES = 3
+WRITE_RETRY_DELAY = 0.1
+
+
+class WriteBatcher:
+    """
+    Buffers job saves and writes them from a background thread
+    
+    Saves are grouped into a single transaction of up to max_batch jobs,
+    waiting at most max_delay_ms after the first one for more to arrive.
+    """
+    
+    def __init__(self, storage, max_batch: int = 64, max_delay_ms: float = 5):
+        """
+        Initialize batcher and start its flusher thread
+        
+        Args:
+            storage: JobStorage to write to
+            max_batch: Maximum number of jobs per transaction
+            max_delay_ms: Maximum time to hold a save while a batch fills
+        """
+        self.storage = storage
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self._queue = queue.Queue()
+        self._batch_full = threading.Event()
+        self._closed = False
+        # Makes checking _closed and queueing atomic against close(), so no
+        # save is queued behind _STOP where it would never be written
+        self._lock = threading.Lock()
+        
+        self._thread = threading.Thread(target=self._run, name="job-write-batcher", daemon=True)
+        self._thread.start()
+        
+        # Don't lose buffered saves when the interpreter exits normally
+        atexit.register(self.close)
+    
+    def enqueue(self, job: Job):
+        """
+        Queue a job to be saved
+        
+        Args:
+            job: Job to save (written as-is when the batch is flushed)
+        """
+        with self._lock:
+            if not self._closed:
+                self._queue.put(job)
+                if self._queue.qsize() >= self.max_batch:
+                    self._batch_full.set()
+                return
+        
+        self.storage.save_job(job)
+    
+    def flush(self):
+        """Block until every queued save has been written"""
+        self._queue.join()
+    
+    def close(self):
+        """Write remaining saves and stop the flusher thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+    
+    def _run(self):
+        """Flusher loop: wait for a save, collect a batch, write it"""
+        while True:
+            item = self._queue.get()
+            if item is not _STOP:
+                # Give other saves a short window to join this batch
+                self._batch_full.wait(self.max_delay)
+            self._batch_full.clear()
+            
+            batch = []
+            taken = 1
+            stop = False
+            while True:
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                    taken += 1
+                except queue.Empty:
+                    break
+            
+            try:
+                if batch:
+                    self._write(batch)
+            except Exception:
+                logger.exception("Failed to write %d job update(s)", len(batch))
+            finally:
+                # Always release flush() waiters, even if the write failed
+                for _ in range(taken):
+                    self._queue.task_done()
+            
+            if stop:
+                return
+    
+    def _write(self, batch):
+        """
+        Write a batch in one transaction, retrying if the write fails
+        
+        Args:
+            batch: Jobs to save
+        """
+        delay = WRITE_RETRY_DELAY
+        for attempt in range(WRITE_RETRIES + 1):
+            if self.storage.save_jobs(batch, replace=True):
+                return
+            if attempt < WRITE_RETRIES:
+                time.sleep(delay)
+                delay *= 2
+        
+        # Jobs whose completion was lost stay in processing until the next
+        # `worker start` recovers them
+        logger.error(
+            "Failed to write %d job update(s) after %d attempts: %s",
+            len(batch), WRITE_RETRIES + 1, ", ".join(job.id for job in batch)
+        )
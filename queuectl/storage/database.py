@@ -3,14 +3,26 @@ Persistent storage layer for jobs using SQLite
 Thread-safe implementation with proper locking
 """
 
+import atexit
 import sqlite3
 import json
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence, Set
 from contextlib import contextmanager
 from threading import Lock
 
 from queuectl.models import Job, JobState
+from queuectl.utils import utc_iso
+
+# Job claims use UPDATE ... RETURNING, added in SQLite 3.35
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+
+def _job_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Job:
+    """Row factory turning a full job row (Job column order) into a Job"""
+    return Job(*row)
 
 
 class JobStorage:
@@ -19,20 +31,137 @@ class JobStorage:
     Thread-safe with connection pooling per thread
     """
     
+    # Job columns in Job constructor order; list_jobs_summary() may
+    # project any of them
+    COLUMNS = (
+        'id', 'command', 'state', 'attempts', 'max_retries',
+        'created_at', 'updated_at', 'next_retry_at', 'error_message'
+    )
+    # Select list for full rows, so _job_row_factory maps columns positionally
+    _JOB_COLUMNS = ", ".join(COLUMNS)
+    
+    # Job states, in the order get_stats() reports them
+    STATES = (
+        JobState.PENDING, JobState.PROCESSING, JobState.COMPLETED,
+        JobState.FAILED, JobState.DEAD
+    )
+    
+    # Statements used on hot paths, kept as constants so they are built
+    # once and each connection's statement cache (sqlite3 keeps the last
+    # 128 per connection) finds the same SQL text on every call
+    # Updates an existing row in place (unlike INSERT OR REPLACE, which
+    # deletes and reinserts it); created_at is kept from the first insert
+    _SQL_UPSERT_JOB = """
+        INSERT INTO jobs 
+        (id, command, state, attempts, max_retries, 
+         created_at, updated_at, next_retry_at, error_message)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET 
+            command = excluded.command, 
+            state = excluded.state, 
+            attempts = excluded.attempts, 
+            max_retries = excluded.max_retries, 
+            updated_at = excluded.updated_at, 
+            next_retry_at = excluded.next_retry_at, 
+            error_message = excluded.error_message
+    """
+    _SQL_INSERT_JOB = """
+        INSERT INTO jobs 
+        (id, command, state, attempts, max_retries, 
+         created_at, updated_at, next_retry_at, error_message)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _SQL_GET_JOB = f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?"
+    _SQL_CLAIM_PENDING = f"""
+        UPDATE jobs 
+        SET state = ?, updated_at = ?
+        WHERE id = (
+            SELECT id FROM jobs 
+            WHERE state = ? 
+            ORDER BY created_at ASC 
+            LIMIT 1
+        )
+        RETURNING {_JOB_COLUMNS}
+    """
+    _SQL_CLAIM_PENDING_BATCH = f"""
+        UPDATE jobs 
+        SET state = ?, updated_at = ?
+        WHERE id IN (
+            SELECT id FROM jobs 
+            WHERE state = ? 
+            ORDER BY created_at ASC 
+            LIMIT ?
+        )
+        RETURNING {_JOB_COLUMNS}
+    """
+    # Due retries come from the partial index idx_next_retry, which holds
+    # only failed jobs ordered by retry time. The planner would otherwise
+    # walk every failed job through a state index; the state is inlined
+    # rather than bound so the index's WHERE clause provably applies.
+    _SQL_PROMOTE_RETRIES = f"""
+        UPDATE jobs INDEXED BY idx_next_retry 
+        SET state = ?, updated_at = ?
+        WHERE state = '{JobState.FAILED}' 
+        AND next_retry_at <= ?
+    """
+    _SQL_RELEASE_JOB = """
+        UPDATE jobs 
+        SET state = ?, updated_at = ?
+        WHERE id = ? AND state = ?
+    """
+    _SQL_GET_RETRYABLE = f"""
+        SELECT {_JOB_COLUMNS} FROM jobs INDEXED BY idx_next_retry 
+        WHERE state = '{JobState.FAILED}' 
+        AND next_retry_at <= ?
+        ORDER BY next_retry_at ASC
+    """
+    _SQL_LIST_JOBS = f"""
+        SELECT {_JOB_COLUMNS} FROM jobs 
+        ORDER BY updated_at DESC 
+        LIMIT ?
+    """
+    _SQL_LIST_JOBS_BY_STATE = f"""
+        SELECT {_JOB_COLUMNS} FROM jobs 
+        WHERE state = ? 
+        ORDER BY updated_at DESC 
+        LIMIT ?
+    """
+    _SQL_GET_STATS = "SELECT state, n FROM job_counters"
+    
     def __init__(self, db_path: str = "queuectl.db"):
         """
         Initialize storage with database path
         
         Args:
             db_path: Path to SQLite database file
+        
+        Raises:
+            RuntimeError: If the SQLite library is older than MIN_SQLITE_VERSION
         """
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            raise RuntimeError(
+                f"queuectl requires SQLite {'.'.join(map(str, MIN_SQLITE_VERSION))} "
+                f"or newer (found {sqlite3.sqlite_version})"
+            )
+        
         self.db_path = db_path
         self.lock = Lock()
+        
+        # One connection per thread, opened on first use and kept open
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = Lock()
+        atexit.register(self.close)
+        
         self._init_db()
     
     def _init_db(self):
         """Initialize database schema with tables and indices"""
         with self._get_connection() as conn:
+            # WAL lets worker processes read while another one writes;
+            # the setting is persistent in the database file
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             # Create jobs table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
@@ -48,11 +177,15 @@ class JobStorage:
                 )
             """)
             
-            # Create indices for common queries
+            # Create indices for common queries. Claims read the oldest
+            # pending job straight off idx_state_created instead of sorting
+            # every pending job; it also serves plain state lookups, which
+            # made the older idx_state redundant.
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_state 
-                ON jobs(state)
+                CREATE INDEX IF NOT EXISTS idx_state_created 
+                ON jobs(state, created_at)
             """)
+            conn.execute("DROP INDEX IF EXISTS idx_state")
             
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_next_retry 
@@ -65,22 +198,149 @@ class JobStorage:
                 ON jobs(created_at)
             """)
             
+            # Serves state-filtered listings ordered by updated_at and
+            # the cleanup DELETE without a table scan
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_state_updated 
+                ON jobs(state, updated_at)
+            """)
+            
             conn.commit()
+            
+            self._init_counters(conn)
+    
+    def _init_counters(self, conn: sqlite3.Connection):
+        """
+        Create the per-state job counters and the triggers that keep them current
+        
+        Counters are seeded from the jobs table when first created, so
+        existing databases get correct counts.
+        
+        Args:
+            conn: Open database connection
+        """
+        check_sql = "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'job_counters_delete'"
+        if conn.execute(check_sql).fetchone():
+            return
+        
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have set them up while we waited for the lock
+            if conn.execute(check_sql).fetchone() is None:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS job_counters (
+                        state TEXT PRIMARY KEY,
+                        n INTEGER NOT NULL DEFAULT 0
+                    )
+                """)
+                conn.execute("DELETE FROM job_counters")
+                conn.executemany(
+                    "INSERT INTO job_counters (state, n) VALUES (?, 0)",
+                    [(state,) for state in self.STATES]
+                )
+                conn.execute("""
+                    UPDATE job_counters 
+                    SET n = (SELECT COUNT(*) FROM jobs WHERE jobs.state = job_counters.state)
+                """)
+                
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS job_counters_insert 
+                    AFTER INSERT ON jobs 
+                    BEGIN
+                        UPDATE job_counters SET n = n + 1 WHERE state = NEW.state;
+                    END
+                """)
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS job_counters_update 
+                    AFTER UPDATE OF state ON jobs 
+                    WHEN OLD.state IS NOT NEW.state
+                    BEGIN
+                        UPDATE job_counters SET n = n - 1 WHERE state = OLD.state;
+                        UPDATE job_counters SET n = n + 1 WHERE state = NEW.state;
+                    END
+                """)
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS job_counters_delete 
+                    AFTER DELETE ON jobs 
+                    BEGIN
+                        UPDATE job_counters SET n = n - 1 WHERE state = OLD.state;
+                    END
+                """)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open and configure a new database connection
+        
+        Returns:
+            SQLite connection object
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # In WAL mode NORMAL only syncs at checkpoints; commits stay durable
+        # across application crashes, just not across power loss
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Serve reads of hot pages from a 64 MB memory map and a 64 MB
+        # page cache (negative cache_size is in KiB) rather than read() calls
+        conn.execute("PRAGMA mmap_size=67108864")
+        conn.execute("PRAGMA cache_size=-65536")
+        return conn
     
     @contextmanager
     def _get_connection(self):
         """
-        Get database connection with context manager
+        Get this thread's database connection with context manager
+        
+        The connection is reused across calls; any transaction left open
+        by a failed block is rolled back.
         
         Yields:
             SQLite connection object
         """
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         try:
             yield conn
-        finally:
-            conn.close()
+        except BaseException:
+            conn.rollback()
+            raise
+    
+    @staticmethod
+    def _job_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """
+        Get a cursor whose rows come back as Job objects
+        
+        Use only with statements selecting _JOB_COLUMNS.
+        
+        Args:
+            conn: Open database connection
+            
+        Returns:
+            Cursor with a Job row factory
+        """
+        cursor = conn.cursor()
+        cursor.row_factory = _job_row_factory
+        return cursor
+    
+    def close(self):
+        """Close every connection opened by this storage"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        # Threads that open a connection after this get a fresh one
+        self._local = threading.local()
     
     def save_job(self, job: Job) -> bool:
         """
@@ -88,19 +348,14 @@ class JobStorage:
         
         Args:
             job: Job object to save
-            
+        
         Returns:
             True if successful, False otherwise
         """
         with self.lock:
             with self._get_connection() as conn:
                 try:
-                    conn.execute("""
-                        INSERT OR REPLACE INTO jobs 
-                        (id, command, state, attempts, max_retries, 
-                         created_at, updated_at, next_retry_at, error_message)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
+                    conn.execute(self._SQL_UPSERT_JOB, (
                         job.id, job.command, job.state, job.attempts,
                         job.max_retries, job.created_at, job.updated_at,
                         job.next_retry_at, job.error_message
@@ -111,65 +366,163 @@ class JobStorage:
                     print(f"Database error: {e}")
                     return False
     
+    def save_jobs(self, jobs: List[Job], replace: bool = False) -> bool:
+        """
+        Insert several jobs in a single transaction
+        
+        Args:
+            jobs: Job objects to insert
+            replace: Overwrite existing jobs with the same ID instead of failing
+        
+        Returns:
+            True if successful, False otherwise (no job is written)
+        """
+        rows = [
+            (
+                job.id, job.command, job.state, job.attempts,
+                job.max_retries, job.created_at, job.updated_at,
+                job.next_retry_at, job.error_message
+            )
+            for job in jobs
+        ]
+        
+        with self.lock:
+            with self._get_connection() as conn:
+                try:
+                    # Take the write lock before the first row, so a busy
+                    # database is waited out here instead of mid-batch
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.executemany(
+                        self._SQL_UPSERT_JOB if replace else self._SQL_INSERT_JOB, rows
+                    )
+                    conn.commit()
+                    return True
+                except sqlite3.Error as e:
+                    conn.rollback()
+                    print(f"Database error: {e}")
+                    return False
+    
     def get_job(self, job_id: str) -> Optional[Job]:
         """
         Retrieve a job by ID
         
         Args:
             job_id: Unique job identifier
-            
+        
         Returns:
             Job object if found, None otherwise
         """
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM jobs WHERE id = ?", (job_id,)
-            )
-            row = cursor.fetchone()
-            
-            if row:
-                return Job(**dict(row))
-            return None
+            return self._job_cursor(conn).execute(self._SQL_GET_JOB, (job_id,)).fetchone()
+    
+    def get_existing_ids(self, job_ids: Iterable[str]) -> Set[str]:
+        """
+        Find which of the given job IDs are already stored
+        
+        Args:
+            job_ids: Job identifiers to look up
+        
+        Returns:
+            Set of IDs that exist in the database
+        """
+        job_ids = list(job_ids)
+        existing = set()
+        
+        with self._get_connection() as conn:
+            # Stay well below SQLite's limit on bound parameters per statement
+            for start in range(0, len(job_ids), 500):
+                chunk = job_ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT id FROM jobs WHERE id IN ({placeholders})", chunk
+                )
+                existing.update(row['id'] for row in cursor.fetchall())
+        
+        return existing
     
     def get_next_pending_job(self) -> Optional[Job]:
         """
         Get the next pending job and atomically mark it as processing
-        This is a critical operation that prevents duplicate processing
+        
+        Selecting and claiming the job is a single UPDATE ... RETURNING
+        statement, so SQLite's write lock is all that prevents duplicate
+        processing (requires SQLite 3.35+).
         
         Returns:
             Job object if available, None otherwise
         """
-        with self.lock:
-            with self._get_connection() as conn:
-                # Get oldest pending job
-                cursor = conn.execute("""
-                    SELECT * FROM jobs 
-                    WHERE state = ? 
-                    ORDER BY created_at ASC 
-                    LIMIT 1
-                """, (JobState.PENDING,))
-                
-                row = cursor.fetchone()
-                if not row:
-                    return None
-                
-                job = Job(**dict(row))
-                
-                # Atomically update to processing
-                job.update_state(JobState.PROCESSING)
-                conn.execute("""
-                    UPDATE jobs 
-                    SET state = ?, updated_at = ?
-                    WHERE id = ? AND state = ?
-                """, (job.state, job.updated_at, job.id, JobState.PENDING))
-                
-                conn.commit()
-                
-                # Verify we got the lock
-                if conn.total_changes == 0:
-                    return None
-                
-                return job
+        now = utc_iso()
+        
+        with self._get_connection() as conn:
+            cursor = self._job_cursor(conn).execute(
+                self._SQL_CLAIM_PENDING, (JobState.PROCESSING, now, JobState.PENDING)
+            )
+            job = cursor.fetchone()
+            conn.commit()
+            return job
+    
+    def claim_next_job(self) -> Optional[Job]:
+        """
+        Move due retries back to pending and claim the oldest pending job
+        
+        Returns:
+            Claimed Job object (already marked as processing), or None
+        """
+        jobs = self.claim_jobs(1)
+        return jobs[0] if jobs else None
+    
+    def claim_jobs(self, limit: int) -> List[Job]:
+        """
+        Move due retries back to pending and claim the oldest pending jobs
+        
+        Both steps run in a single transaction using UPDATE ... RETURNING,
+        so a worker poll costs one round-trip (requires SQLite 3.35+).
+        The first UPDATE takes SQLite's write lock, which serializes
+        concurrent claims without a Python lock.
+        
+        Args:
+            limit: Maximum number of jobs to claim
+        
+        Returns:
+            Claimed Job objects (already marked as processing), oldest first
+        """
+        now = utc_iso()
+        
+        with self._get_connection() as conn:
+            # Failed jobs whose backoff has expired become pending again
+            conn.execute(self._SQL_PROMOTE_RETRIES, (JobState.PENDING, now, now))
+            
+            # Claim the oldest pending jobs
+            cursor = self._job_cursor(conn).execute(
+                self._SQL_CLAIM_PENDING_BATCH,
+                (JobState.PROCESSING, now, JobState.PENDING, limit)
+            )
+            jobs = cursor.fetchall()
+            conn.commit()
+        
+        # RETURNING doesn't follow the subquery's ORDER BY
+        jobs.sort(key=lambda job: job.created_at)
+        return jobs
+    
+    def release_jobs(self, job_ids: Sequence[str]) -> int:
+        """
+        Return claimed jobs that were never started to pending
+        
+        Args:
+            job_ids: IDs of jobs in processing state
+            
+        Returns:
+            Number of jobs released
+        """
+        now = utc_iso()
+        
+        with self._get_connection() as conn:
+            cursor = conn.executemany(
+                self._SQL_RELEASE_JOB,
+                [(JobState.PENDING, now, job_id, JobState.PROCESSING) for job_id in job_ids]
+            )
+            conn.commit()
+            return cursor.rowcount
     
     def get_retryable_jobs(self) -> List[Job]:
         """
@@ -178,20 +531,10 @@ class JobStorage:
         Returns:
             List of Job objects ready for retry
         """
-        from datetime import datetime
-        
-        now = datetime.utcnow().isoformat() + "Z"
+        now = utc_iso()
         
         with self._get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM jobs 
-                WHERE state = ? 
-                AND next_retry_at IS NOT NULL 
-                AND next_retry_at <= ?
-                ORDER BY next_retry_at ASC
-            """, (JobState.FAILED, now))
-            
-            return [Job(**dict(row)) for row in cursor.fetchall()]
+            return self._job_cursor(conn).execute(self._SQL_GET_RETRYABLE, (now,)).fetchall()
     
     def list_jobs(self, state: Optional[str] = None, limit: int = 100) -> List[Job]:
         """
@@ -200,71 +543,126 @@ class JobStorage:
         Args:
             state: Filter by job state (optional)
             limit: Maximum number of jobs to return
-            
+        
         Returns:
             List of Job objects
         """
         with self._get_connection() as conn:
+            cursor = self._job_cursor(conn)
             if state:
-                cursor = conn.execute("""
-                    SELECT * FROM jobs 
+                cursor.execute(self._SQL_LIST_JOBS_BY_STATE, (state, limit))
+            else:
+                cursor.execute(self._SQL_LIST_JOBS, (limit,))
+            
+            return cursor.fetchall()
+    
+    def list_jobs_summary(
+        self,
+        state: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        columns: Sequence[str] = ('id', 'state', 'command', 'attempts', 'max_retries', 'updated_at')
+    ) -> List[tuple]:
+        """
+        List selected columns of jobs without building Job objects
+        
+        Args:
+            state: Filter by job state (optional)
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip, for paging through results
+            columns: Columns to select, in order
+        
+        Returns:
+            List of tuples with the requested columns
+        
+        Raises:
+            ValueError: If an unknown column is requested
+        """
+        unknown = [column for column in columns if column not in self.COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown job column(s): {', '.join(unknown)}")
+        
+        projection = ", ".join(columns)
+        
+        with self._get_connection() as conn:
+            # Plain tuples are all the callers need
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            if state:
+                cursor.execute(f"""
+                    SELECT {projection} FROM jobs 
                     WHERE state = ? 
                     ORDER BY updated_at DESC 
-                    LIMIT ?
-                """, (state, limit))
+                    LIMIT ? OFFSET ?
+                """, (state, limit, offset))
             else:
-                cursor = conn.execute("""
-                    SELECT * FROM jobs 
+                cursor.execute(f"""
+                    SELECT {projection} FROM jobs 
                     ORDER BY updated_at DESC 
-                    LIMIT ?
-                """, (limit,))
+                    LIMIT ? OFFSET ?
+                """, (limit, offset))
             
-            return [Job(**dict(row)) for row in cursor.fetchall()]
+            return cursor.fetchall()
     
     def get_stats(self) -> dict:
         """
         Get job statistics by state
         
+        Reads the trigger-maintained job_counters table, so the cost
+        doesn't grow with the number of jobs.
+        
         Returns:
             Dictionary with counts for each state and total
         """
         with self._get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT state, COUNT(*) as count 
-                FROM jobs 
-                GROUP BY state
-            """)
-            
-            stats = {
-                JobState.PENDING: 0,
-                JobState.PROCESSING: 0,
-                JobState.COMPLETED: 0,
-                JobState.FAILED: 0,
-                JobState.DEAD: 0
-            }
+            cursor = conn.execute(self._SQL_GET_STATS)
             
-            for row in cursor.fetchall():
-                stats[row['state']] = row['count']
+            stats = dict.fromkeys(self.STATES, 0)
+            for state, count in cursor.fetchall():
+                stats[state] = count
             
             stats['total'] = sum(stats.values())
             
             return stats
     
+    def retry_dlq(self, job_id: str) -> bool:
+        """
+        Move a dead job back to pending with its attempts and error cleared
+        
+        Args:
+            job_id: Unique job identifier
+        
+        Returns:
+            True if a dead job was reset, False otherwise
+        """
+        now = utc_iso()
+        
+        with self.lock:
+            with self._get_connection() as conn:
+                cursor = conn.execute("""
+                    UPDATE jobs 
+                    SET state = ?, attempts = 0, next_retry_at = NULL, 
+                        error_message = NULL, updated_at = ?
+                    WHERE id = ? AND state = ?
+                """, (JobState.PENDING, now, job_id, JobState.DEAD))
+                conn.commit()
+                return cursor.rowcount == 1
+    
     def delete_job(self, job_id: str) -> bool:
         """
         Delete a job from the database
         
         Args:
             job_id: Unique job identifier
-            
+        
         Returns:
             True if job was deleted, False otherwise
         """
         with self.lock:
             with self._get_connection() as conn:
-                conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+                cursor = conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
                 conn.commit()
-                return conn.total_changes > 0
+                return cursor.rowcount > 0
     
     def reset_processing_jobs(self):
         """
@@ -273,8 +671,7 @@ class JobStorage:
         """
         with self.lock:
             with self._get_connection() as conn:
-                from datetime import datetime
-                now = datetime.utcnow().isoformat() + "Z"
+                now = utc_iso()
                 
                 cursor = conn.execute("""
                     SELECT COUNT(*) as count FROM jobs WHERE state = ?
@@ -297,15 +694,13 @@ class JobStorage:
         
         Args:
             days: Number of days to keep completed jobs
-            
+        
         Returns:
             Number of jobs deleted
         """
         with self.lock:
             with self._get_connection() as conn:
-                from datetime import datetime, timedelta
-                
-                cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat() + "Z"
+                cutoff = utc_iso(time.time() - days * 86400)
                 
                 cursor = conn.execute("""
                     DELETE FROM jobs 
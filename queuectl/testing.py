@@ -0,0 +1,36 @@
+"""
+Helper for running queuectl commands in-process, for tests and scripts
+"""
+
+import io
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Tuple
+
+from queuectl import cli as cli_module
+
+
+def invoke(*args: str) -> Tuple[int, str, str]:
+    """
+    Run a queuectl command in this process
+    
+    The CLI is reset afterwards (see queuectl.cli.reset), so the next
+    command starts from what is on disk with the original signal handlers.
+    
+    Args:
+        *args: Command-line arguments, e.g. "add", "job1", "echo hi"
+    
+    Returns:
+        Tuple of (exit code, stdout, stderr)
+    """
+    # Binary-backed stdout: JSON output is written to sys.stdout.buffer
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8', write_through=True)
+    stderr = io.StringIO()
+    code = 0
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            cli_module.cli(list(args))
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        cli_module.reset()
+    return code, stdout.buffer.getvalue().decode('utf-8'), stderr.getvalue()
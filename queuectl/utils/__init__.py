@@ -3,5 +3,6 @@ Utils package
 """
 
 from .config import Config
+from .clock import utc_iso
 
-__all__ = ['Config']
\ No newline at end of file
+__all__ = ['Config', 'utc_iso']
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+UTC timestamp formatting
+"""
+
+import time
+from typing import Optional
+
+
+# (whole second, formatted prefix) of the last timestamp formatted; jobs
+# change state many times a second, so the strftime call is mostly skipped
+_last_second = (None, "")
+
+
+def utc_iso(timestamp: Optional[float] = None) -> str:
+    """
+    Format a Unix timestamp as an ISO 8601 UTC string
+    
+    Always includes microseconds (e.g. 2024-01-01T12:00:00.000000Z), so
+    stored timestamps compare correctly as strings.
+    
+    Args:
+        timestamp: Seconds since the epoch (current time if None)
+        
+    Returns:
+        Timestamp string ending in "Z"
+    """
+    global _last_second
+    
+    if timestamp is None:
+        timestamp = time.time()
+    
+    second = int(timestamp)
+    cached_second, prefix = _last_second
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _last_second = (second, prefix)
+    
+    return f"{prefix}.{int((timestamp - second) * 1000000):06d}Z"
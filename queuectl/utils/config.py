@@ -2,7 +2,10 @@
 Configuration management with persistent storage
 """
 
+import atexit
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
@@ -18,9 +21,14 @@ class Config:
         'backoff_base': 2.0,
         'job_timeout': 300,  # 5 minutes default timeout
         'poll_interval': 1,  # Worker poll interval in seconds
+        'batch_size': 1,  # Jobs a worker claims per poll (capped at 8)
         'worker_shutdown_timeout': 10,  # Timeout for graceful worker shutdown
     }
     
+    # Seconds a change waits before being written, so a burst of set()
+    # calls results in a single file write
+    FLUSH_DELAY = 0.5
+    
     def __init__(self, config_file: str = "queuectl_config.json"):
         """
         Initialize configuration
@@ -29,7 +37,13 @@ class Config:
             config_file: Path to configuration file
         """
         self.config_file = Path(config_file)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer = None
         self.config = self._load_config()
+        
+        # Write changes still waiting for the flush timer
+        atexit.register(self.flush)
     
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -60,15 +74,22 @@ class Config:
         """
         Save configuration to file
         
+        The file is written to a temporary file and atomically moved into
+        place, so readers never see a partially written configuration.
+        It isn't fsync'ed: settings are cheap to set again, and durability
+        across power loss isn't worth a disk flush per change.
+        
         Args:
             config: Configuration dictionary to save (uses self.config if None)
         """
         if config is None:
             config = self.config
         
+        tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
         try:
-            with open(self.config_file, 'w') as f:
+            with open(tmp_file, 'w') as f:
                 json.dump(config, f, indent=2)
+            os.replace(tmp_file, self.config_file)
         except IOError as e:
             print(f"Warning: Could not save configuration: {e}")
     
@@ -85,16 +106,39 @@ class Config:
         """
         return self.config.get(key, default)
     
-    def set(self, key: str, value: Any):
+    def set(self, key: str, value: Any, flush: bool = False):
         """
         Set configuration value and persist to file
         
+        The file is written FLUSH_DELAY seconds later (together with any
+        other changes made meanwhile), on flush(), or at exit.
+        
         Args:
             key: Configuration key
             value: Value to set
+            flush: Write the file now instead of after the delay
         """
-        self.config[key] = value
-        self._save_config()
+        with self._lock:
+            self.config[key] = value
+            self._dirty = True
+            if not flush and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        if flush:
+            self.flush()
+    
+    def flush(self):
+        """Write pending changes to the configuration file"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save_config()
     
     def get_all(self) -> Dict[str, Any]:
         """
@@ -107,8 +151,13 @@ class Config:
     
     def reset(self):
         """Reset configuration to defaults"""
-        self.config = self.DEFAULT_CONFIG.copy()
-        self._save_config()
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+            self.config = self.DEFAULT_CONFIG.copy()
+            self._save_config()
     
     def validate(self) -> bool:
         """
@@ -4,139 +4,238 @@ QueueCTL Cross-Platform Test Runner
 Works on Windows, Mac, and Linux
 """
 
+import shutil
+import sqlite3
 import subprocess
 import os
+import signal
 import sys
+import tempfile
 import time
 from pathlib import Path
 
+# In-memory filesystem for the scratch directory, where the platform has one
+SHM_DIR = '/dev/shm'
+
+# Seconds to wait for the worker to finish the test jobs, and to exit once stopped
+WORKER_TIMEOUT = 10
+STOP_TIMEOUT = 2
+
 
 class TestRunner:
     def __init__(self):
         self.passed = 0
         self.failed = 0
+        self.worker_proc = None
+        # Check marks only on a terminal: logs and legacy Windows code pages
+        # get plain ASCII (and can't fail to encode it)
+        self.pass_mark, self.fail_mark = ('✓ ', '✗ ') if sys.stdout.isatty() else ('', '')
         
-    def cleanup(self):
-        """Clean test environment"""
-        for f in ['queuectl.db', 'queuectl_config.json']:
-            try:
-                os.remove(f)
-            except:
-                pass
-    
-    def run_command(self, cmd):
-        """Run command and return success/failure"""
+    def start_worker(self):
+        """
+        Start `queuectl worker start` in the background
+        
+        Returns:
+            True if the worker was started; otherwise a failure is recorded
+        """
         try:
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30
+            self.worker_proc = subprocess.Popen(
+                ['queuectl', 'worker', 'start'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=sys.platform != 'win32'
             )
-            return result.returncode == 0, result.stdout, result.stderr
-        except Exception as e:
-            return False, "", str(e)
+        except OSError as e:
+            # Without a shell there's no "command not found" exit code;
+            # e.g. queuectl isn't on PATH
+            self.record("Start worker", False, str(e))
+            return False
+        return True
     
-    def test(self, name, cmd, check_output=None):
-        """Run a test"""
-        print(f"Testing: {name}")
-        success, stdout, stderr = self.run_command(cmd)
+    def stop_worker(self):
+        """Stop the background worker and wait for it to exit"""
+        proc = self.worker_proc
+        if proc.poll() is None:
+            if sys.platform == 'win32':
+                proc.terminate()
+            else:
+                # The worker has its own session: signal the group so its
+                # worker processes shut down too
+                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+        try:
+            proc.wait(timeout=STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    
+    def job_state(self, job_id):
+        """Read a job's state straight from the database (None if unavailable)"""
+        try:
+            conn = sqlite3.connect('file:queuectl.db?mode=ro', uri=True)
+        except sqlite3.Error:
+            return None
+        try:
+            row = conn.execute("SELECT state FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error:
+            return None
+        finally:
+            conn.close()
+    
+    def wait_for(self, pred, timeout=10, interval=0.05):
+        """Poll pred() until it is true or timeout seconds pass; returns whether it became true"""
+        deadline = time.monotonic() + timeout
+        while not pred():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+        return True
+    
+    def run_batch(self, checks):
+        """
+        Run queuectl CLI checks inside this process
         
-        # Additional output check if specified
-        if success and check_output:
-            if check_output not in stdout and check_output not in stderr:
-                success = False
+        Args:
+            checks: List of (name, argv, expected_output) tuples, run in order;
+                expected_output is None, a string, or a tuple of strings that
+                must all appear
         
+        Returns:
+            Dict mapping each check name to (success, error)
+        """
+        try:
+            from queuectl.testing import invoke
+        except ImportError as e:
+            return {name: (False, f"Cannot import queuectl: {e}") for name, _, _ in checks}
+        
+        results = {}
+        for name, argv, expected in checks:
+            try:
+                code, stdout, stderr = invoke(*argv)
+            except Exception as e:
+                code, stdout, stderr = 1, "", f"{type(e).__name__}: {e}"
+            output = stdout + stderr
+            if isinstance(expected, str):
+                expected = (expected,)
+            if code == 0 and all(text in output for text in expected or ()):
+                results[name] = (True, "")
+            else:
+                results[name] = (False, output[:100])
+        return results
+    
+    def record(self, name, success, error=""):
+        """Print and count a test result"""
+        print(f"Testing: {name}")
         if success:
-            print("  ✓ PASS")
+            print(f"  {self.pass_mark}PASS")
             self.passed += 1
         else:
-            print("  ✗ FAIL")
-            if stdout or stderr:
-                error = (stdout + stderr)[:100]
+            print(f"  {self.fail_mark}FAIL")
+            if error:
                 print(f"  Error: {error}")
             self.failed += 1
     
+    def section(self, title, checks, results):
+        """Print the results of a group of batched checks"""
+        print(title)
+        print("-" * 50)
+        for name, _, _ in checks:
+            self.record(name, *results[name])
+        print()
+    
     def run_all(self):
-        """Run all tests"""
+        """
+        Run all tests in a fresh scratch directory
+        
+        The directory is on tmpfs where available, so SQLite commits don't
+        wait on disk, and any queuectl files in the caller's directory are
+        left alone. It is removed afterwards.
+        """
+        cwd = os.getcwd()
+        scratch = tempfile.mkdtemp(
+            prefix='queuectl-test-', dir=SHM_DIR if os.path.isdir(SHM_DIR) else None
+        )
+        os.chdir(scratch)
+        try:
+            return self.run_tests()
+        finally:
+            if self.worker_proc is not None:
+                self.stop_worker()
+            os.chdir(cwd)
+            shutil.rmtree(scratch, ignore_errors=True)
+    
+    def run_tests(self):
+        """Run all tests in the current directory"""
         print("=" * 50)
         print("QueueCTL Cross-Platform Test")
         print("=" * 50)
         print()
         
-        # Cleanup
-        self.cleanup()
-        
-        # 1. Installation
-        print("1. INSTALLATION CHECK")
-        print("-" * 50)
-        self.test("Version command", "queuectl --version")
-        self.test("Help command", "queuectl --help")
-        print()
-        
-        # 2. Job Enqueuing
-        print("2. JOB ENQUEUING")
-        print("-" * 50)
-        self.test("Add job (simple)", 'queuectl add job1 "echo test"')
-        self.test("Add job (with retries)", 'queuectl add job2 "echo test2" -r 5')
-        self.test("List jobs", "queuectl list", check_output="job1")
-        print()
-        
-        # 3. Configuration
-        print("3. CONFIGURATION")
-        print("-" * 50)
-        self.test("Set max-retries", "queuectl config set max-retries 5")
-        self.test("Set backoff-base", "queuectl config set backoff-base 2.0")
-        self.test("Set poll-interval", "queuectl config set poll-interval 2")
-        self.test("Show config", "queuectl config show", check_output="max-retries")
-        print()
+        # 1-3. Installation, enqueuing and configuration, run in this process
+        sections = [
+            ("1. INSTALLATION CHECK", [
+                ("Version command", ["--version"], None),
+                ("Help command", ["--help"], None),
+            ]),
+            ("2. JOB ENQUEUING", [
+                ("Add job (simple)", ["add", "job1", "echo test"], None),
+                ("Add job (with retries)", ["add", "job2", "echo test2", "-r", "5"], None),
+                ("List jobs", ["list"], "job1"),
+            ]),
+            ("3. CONFIGURATION", [
+                ("Set max-retries", ["config", "set", "max-retries", "5"], None),
+                ("Set backoff-base", ["config", "set", "backoff-base", "2.0"], None),
+                ("Set poll-interval", ["config", "set", "poll-interval", "2"], None),
+                ("Show config", ["config", "show"], "max-retries"),
+            ]),
+        ]
+        results = self.run_batch([check for _, checks in sections for check in checks])
+        for title, checks in sections:
+            self.section(title, checks, results)
         
         # 4. Worker Execution
         print("4. WORKER EXECUTION")
         print("-" * 50)
-        print("  Starting worker for 5 seconds...")
+        print("  Starting worker until jobs complete...")
         
-        # Start worker in background
-        if sys.platform == 'win32':
-            subprocess.Popen(
-                'queuectl worker start',
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-        else:
-            subprocess.Popen(
-                'queuectl worker start',
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid
+        # Start worker in background; checks of its results are skipped if
+        # it can't be started
+        worker_checks = []
+        if self.start_worker():
+            jobs = ('job1', 'job2')
+            # Stop waiting early if the worker dies instead of polling out the timeout
+            finished = self.wait_for(
+                lambda: self.worker_proc.poll() is not None
+                or all(self.job_state(job_id) == 'completed' for job_id in jobs),
+                timeout=WORKER_TIMEOUT
             )
+            exit_code = self.worker_proc.poll()
+            self.stop_worker()
+            
+            if exit_code is not None:
+                self.record("Jobs completed", False, f"Worker exited early with code {exit_code}")
+            elif not finished:
+                self.record("Jobs completed", False,
+                            f"{', '.join(jobs)} not completed within {WORKER_TIMEOUT}s")
+            else:
+                # Match the job IDs: "No jobs found with state: completed"
+                # contains "completed" too
+                worker_checks.append(("Jobs completed", ["list", "--state", "completed"], jobs))
         
-        time.sleep(6)
-        
-        # Kill worker
-        if sys.platform == 'win32':
-            os.system('taskkill /F /IM python.exe /T >nul 2>&1')
-        else:
-            os.system('pkill -f queuectl')
-        
-        time.sleep(1)
-        self.test("Jobs completed", "queuectl list --state completed", check_output="completed")
+        status = ("Status command", ["status"], None)
+        results = self.run_batch(worker_checks + [status])
+        for name, _, _ in worker_checks:
+            self.record(name, *results[name])
         print()
         
         # 5. Status
-        print("5. STATUS CHECK")
-        print("-" * 50)
-        self.test("Status command", "queuectl status")
-        print()
+        self.section("5. STATUS CHECK", [status], results)
         
         # 6. Data Persistence
         print("6. DATA PERSISTENCE")
         print("-" * 50)
-        self.test("Database exists", f"python -c \"import os; exit(0 if os.path.exists('queuectl.db') else 1)\"")
-        self.test("Config exists", f"python -c \"import os; exit(0 if os.path.exists('queuectl_config.json') else 1)\"")
+        self.record("Database exists", Path('queuectl.db').exists())
+        self.record("Config exists", Path('queuectl_config.json').exists())
         print()
         
         # Summary
@@ -148,10 +247,10 @@ class TestRunner:
         print()
         
         if self.failed == 0:
-            print("✓ All tests passed!")
+            print(f"{self.pass_mark}All tests passed!")
             return 0
         else:
-            print("✗ Some tests failed")
+            print(f"{self.fail_mark}Some tests failed")
             return 1
 
 
@@ -19,9 +19,11 @@ setup(
     author_email='your.email@example.com',
     url='https://github.com/yourusername/queuectl',
     packages=find_packages(exclude=['tests', 'tests.*']),
-    install_requires=[
-        'click>=8.0.0',
-    ],
+    install_requires=[],
+    extras_require={
+        'fast': ['orjson'],
+        'test': ['pytest', 'pytest-xdist'],
+    },
     entry_points={
         'console_scripts': [
             'queuectl=queuectl.cli:cli',
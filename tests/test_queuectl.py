@@ -1,266 +1,288 @@
 """
 Test suite for queuectl
-Run with: python -m pytest tests/ or python tests/test_queuectl.py
+Run with: python -m pytest tests/ (add -n auto to run in parallel with pytest-xdist)
+or python tests/test_queuectl.py
+
+Each test works in its own pytest tmp_path; point TMPDIR at a tmpfs such as
+/dev/shm to keep the test databases in memory.
 """
 
+import json
 import os
+import signal
+import sqlite3
 import time
 import subprocess
 from pathlib import Path
 import sys
 
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Allow running this file directly from a source checkout
+sys.path.insert(0, str(ROOT))
+
+from queuectl import cli
+from queuectl.testing import invoke
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    """
+    Run each test in its own directory
+
+    queuectl keeps its database and config in the working directory, so a
+    private directory per test keeps parallel runs from sharing state.
+    """
+    monkeypatch.chdir(tmp_path)
+    # Worker subprocesses import queuectl from this checkout
+    monkeypatch.setenv(
+        "PYTHONPATH", os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))
+    )
+    yield tmp_path
+    cli.reset()
+
+
+@pytest.fixture(scope="session")
+def worker(tmp_path_factory):
+    """
+    One worker process shared by every test that needs jobs executed
+
+    Yields:
+        Directory the worker runs in (holds its database)
+    """
+    path = tmp_path_factory.mktemp("worker")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'queuectl.cli', 'worker', 'start', '--count', '1'],
+        cwd=path,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    yield path
+    proc.terminate()
+    try:
+        proc.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def wait_for_state(job_id: str, *states: str, timeout: float = 10):
+    """
+    Poll the database in the working directory until a job reaches a state
+
+    Returns:
+        The job's state once it is one of states, or None on timeout
+    """
+    deadline = time.monotonic() + timeout
+    conn = sqlite3.connect("file:queuectl.db?mode=ro", uri=True)
+    try:
+        while time.monotonic() < deadline:
+            row = conn.execute("SELECT state FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row and row[0] in states:
+                return row[0]
+            time.sleep(0.05)
+    finally:
+        conn.close()
+    return None
+
+
+def test_01_enqueue_job():
+    """Test enqueuing a basic job"""
+    # Use the simple add command instead of JSON
+    code, stdout, stderr = invoke("add", "test1", "echo Hello World")
+    assert code == 0, "Enqueue returns success code"
+    assert "Job added successfully" in stdout, "Enqueue shows success message"
+    assert "test1" in stdout, "Enqueue shows job ID"
+
+
+def test_02_enqueue_duplicate():
+    """Test enqueuing duplicate job ID fails"""
+    invoke("add", "test1", "echo Hello World")
+
+    # Try to add duplicate
+    code, stdout, stderr = invoke("add", "test1", "echo Duplicate")
+    assert code == 1, "Duplicate enqueue returns error code"
+    assert "already exists" in stdout + stderr, "Shows duplicate error"
+
+
+def test_03_list_jobs():
+    """Test listing jobs"""
+    invoke("add", "test1", "echo Hello World")
+
+    code, stdout, stderr = invoke("list", "--state", "pending")
+    assert code == 0, "List returns success code"
+    assert "test1" in stdout, "Job appears in list"
+
+
+def test_04_status_command():
+    """Test status command"""
+    code, stdout, stderr = invoke("status")
+    assert code == 0, "Status returns success code"
+    assert "Job Statistics" in stdout, "Status shows statistics"
+    assert "Workers" in stdout, "Status shows worker info"
+
+
+def test_05_worker_execution(worker, monkeypatch):
+    """Test worker executes job successfully"""
+    monkeypatch.chdir(worker)
+    invoke("add", "test1", "echo Hello World")
+
+    wait_for_state("test1", "completed")
+
+    # Check if job completed
+    code, stdout, stderr = invoke("list", "--state", "completed")
+    assert "test1" in stdout, "Job completed successfully"
+
+
+def test_06_failed_job(worker, monkeypatch):
+    """Test job failure and retry"""
+    monkeypatch.chdir(worker)
+    # Enqueue a job that will fail using add command
+    invoke("add", "fail1", "exit 1", "-r", "2")
+
+    wait_for_state("fail1", "failed", "dead")
+
+    # Check job is in failed or dead state
+    code1, stdout1, stderr1 = invoke("list", "--state", "failed")
+    code2, stdout2, stderr2 = invoke("list", "--state", "dead")
+
+    assert "fail1" in stdout1 or "fail1" in stdout2, "Failed job moved to failed or dead state"
+
+
+def test_07_dlq_list():
+    """Test DLQ list command"""
+    code, stdout, stderr = invoke("dlq", "list")
+    assert code == 0, "DLQ list returns success code"
+
+
+def test_08_config_set():
+    """Test configuration management"""
+    code, stdout, stderr = invoke("config", "set", "max-retries", "5")
+    assert code == 0, "Config set returns success code"
+    assert "updated" in stdout, "Config set shows success"
+
+    # Verify config was saved
+    code, stdout, stderr = invoke("config", "show")
+    assert "5" in stdout, "Config shows updated value"
+
+
+def test_09_config_show():
+    """Test config show command"""
+    code, stdout, stderr = invoke("config", "show")
+    assert code == 0, "Config show returns success code"
+    assert "max-retries" in stdout, "Config shows settings"
+
+
+def test_10_persistence():
+    """Test data persists"""
+    # Enqueue a job using add command
+    invoke("add", "persist1", "echo Persistent")
+
+    # List jobs
+    code, stdout, stderr = invoke("list")
+    assert "persist1" in stdout, "Job persists in database"
+
+
+def test_11_multiple_jobs(workdir):
+    """Test multiple job enqueue"""
+    # Enqueue all jobs in one call (and one transaction)
+    batch = workdir / "multi.json"
+    batch.write_text(json.dumps([
+        {"id": f"multi{i}", "command": f"echo Job {i}"} for i in range(3)
+    ]))
+    code, stdout, stderr = invoke("enqueue-batch", str(batch))
+    assert code == 0, "Batch enqueue returns success code"
+
+    code, stdout, stderr = invoke("list", "--state", "pending")
+
+    assert all(f"multi{i}" in stdout for i in range(3)), "All jobs enqueued successfully"
+
+
+def test_12_invalid_json():
+    """Test invalid JSON handling"""
+    # Test with enqueue command (JSON mode)
+    code, stdout, stderr = invoke("enqueue", '{"invalid json')
+    assert code == 1, "Invalid JSON returns error code"
+    assert "Invalid JSON" in stdout + stderr, "Shows JSON error"
+
+    # Test missing required field with add command
+    code, stdout, stderr = invoke("add", "", "echo test")
+    # Should fail with empty ID
+    assert code == 1, "Empty ID returns error code"
+    assert "must not be empty" in stderr, "Shows empty ID error"
+
+    code, stdout, stderr = invoke("add", "   ", "echo test")
+    assert code == 1, "Whitespace-only ID returns error code"
+
+
+def test_13_enqueue_batch(workdir):
+    """Test enqueuing a batch of jobs from a JSON file"""
+    batch = workdir / "test_queuectl_batch.json"
+    batch.write_text(
+        '[{"id": "batch0", "command": "echo Batch 0"},'
+        ' {"id": "batch1", "command": "echo Batch 1", "max_retries": 5}]'
+    )
+    code, stdout, stderr = invoke("enqueue-batch", str(batch))
+    assert code == 0, "Batch enqueue returns success code"
+    assert "2 job(s) enqueued" in stdout, "Batch enqueue shows job count"
+
+    # Re-submitting the same batch must fail without enqueuing anything
+    code, stdout, stderr = invoke("enqueue-batch", str(batch))
+    assert code == 1, "Duplicate batch returns error code"
+    assert "already exist" in stdout + stderr, "Shows duplicate batch error"
+
+    code, stdout, stderr = invoke("list", "--state", "pending")
+    assert all(f"batch{i}" in stdout for i in range(2)), "Batch jobs appear in list"
+
+
+def test_14_config_set_many():
+    """Test setting several configuration values at once"""
+    code, stdout, stderr = invoke("config", "set-many", "job-timeout=120", "poll-interval=1")
+    assert code == 0, "Config set-many returns success code"
+
+    code, stdout, stderr = invoke("config", "show")
+    assert "120s" in stdout, "Config shows values from set-many"
+
+    code, stdout, stderr = invoke("config", "set-many", "job-timeout=60", "poll-interval=0")
+    assert code == 1, "Invalid set-many value returns error code"
+
+    code, stdout, stderr = invoke("config", "show")
+    assert "120s" in stdout, "Invalid set-many leaves config unchanged"
+
+
+def test_15_json_output():
+    """Test machine-readable JSON output"""
+    invoke("add", "persist1", "echo Persistent")
+
+    code, stdout, stderr = invoke("status", "--json")
+    assert code == 0, "Status --json returns success code"
+    stats = json.loads(stdout)
+    assert stats['jobs']['total'] >= 1, "Status JSON contains job counts"
+
+    code, stdout, stderr = invoke("list", "--state", "pending", "--json")
+    assert code == 0, "List --json returns success code"
+    ids = [job['id'] for job in json.loads(stdout)]
+    assert "persist1" in ids, "List JSON contains job IDs"
+
+    code, stdout, stderr = invoke("dlq", "list", "--json")
+    assert isinstance(json.loads(stdout), list), "DLQ list JSON is an array"
+
+
+def test_16_signal_handlers_restored():
+    """Test in-process commands leave this process's signal handlers alone"""
+    handlers = {signum: signal.getsignal(signum) for signum in (signal.SIGINT, signal.SIGTERM)}
+
+    code, stdout, stderr = invoke("status")
+    assert code == 0, "Status returns success code"
 
-class TestRunner:
-    """Simple test runner for queuectl"""
-    
-    def __init__(self):
-        self.passed = 0
-        self.failed = 0
-        self.test_db = "test_queuectl.db"
-        self.test_config = "test_queuectl_config.json"
-    
-    def setup(self):
-        """Setup test environment"""
-        # Remove existing test files
-        for f in [self.test_db, self.test_config]:
-            if Path(f).exists():
-                os.remove(f)
-        print("🔧 Test environment setup complete\n")
-    
-    def teardown(self):
-        """Cleanup test environment"""
-        for f in [self.test_db, self.test_config]:
-            if Path(f).exists():
-                os.remove(f)
-    
-    def run_command(self, cmd: str, capture=True):
-        """Run a shell command"""
-        if capture:
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True
-            )
-            return result.returncode, result.stdout, result.stderr
-        else:
-            return subprocess.run(cmd, shell=True).returncode, "", ""
-    
-    def assert_equals(self, actual, expected, test_name):
-        """Assert equality"""
-        if actual == expected:
-            print(f"✅ PASS: {test_name}")
-            self.passed += 1
-            return True
-        else:
-            print(f"❌ FAIL: {test_name}")
-            print(f"   Expected: {expected}")
-            print(f"   Got: {actual}")
-            self.failed += 1
-            return False
-    
-    def assert_contains(self, text, substring, test_name):
-        """Assert text contains substring"""
-        if substring in text:
-            print(f"✅ PASS: {test_name}")
-            self.passed += 1
-            return True
-        else:
-            print(f"❌ FAIL: {test_name}")
-            print(f"   Expected substring: {substring}")
-            print(f"   In text: {text[:200]}")
-            self.failed += 1
-            return False
-    
-    def test_01_enqueue_job(self):
-        """Test enqueuing a basic job"""
-        # Use the simple add command instead of JSON
-        code, stdout, stderr = self.run_command(
-            'python -m queuectl.cli add test1 "echo Hello World"'
-        )
-        self.assert_equals(code, 0, "Enqueue returns success code")
-        self.assert_contains(stdout, "Job added successfully", "Enqueue shows success message")
-        self.assert_contains(stdout, "test1", "Enqueue shows job ID")
-    
-    def test_02_enqueue_duplicate(self):
-        """Test enqueuing duplicate job ID fails"""
-        # Try to add duplicate
-        code, stdout, stderr = self.run_command(
-            'python -m queuectl.cli add test1 "echo Duplicate"'
-        )
-        self.assert_equals(code, 1, "Duplicate enqueue returns error code")
-        self.assert_contains(stdout + stderr, "already exists", "Shows duplicate error")
-    
-    def test_03_list_jobs(self):
-        """Test listing jobs"""
-        code, stdout, stderr = self.run_command(
-            'python -m queuectl.cli list --state pending'
-        )
-        self.assert_equals(code, 0, "List returns success code")
-        self.assert_contains(stdout, "test1", "Job appears in list")
-    
-    def test_04_status_command(self):
-        """Test status command"""
-        code, stdout, stderr = self.run_command('python -m queuectl.cli status')
-        self.assert_equals(code, 0, "Status returns success code")
-        self.assert_contains(stdout, "Job Statistics", "Status shows statistics")
-        self.assert_contains(stdout, "Workers", "Status shows worker info")
-    
-    def test_05_worker_execution(self):
-        """Test worker executes job successfully"""
-        print("   Starting worker for 5 seconds...")
-        proc = subprocess.Popen(
-            'timeout 5 python -m queuectl.cli worker start --count 1 || true',
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        
-        time.sleep(6)
-        
-        # Check if job completed
-        code, stdout, stderr = self.run_command(
-            'python -m queuectl.cli list --state completed'
-        )
-        self.assert_contains(stdout, "test1", "Job completed successfully")
-    
-    def test_06_failed_job(self):
-        """Test job failure and retry"""
-        # Enqueue a job that will fail using add command
-        self.run_command(
-            'python -m queuectl.cli add fail1 "exit 1" -r 2'
-        )
-        
-        # Start worker
-        print("   Starting worker to process failing job...")
-        proc = subprocess.Popen(
-            'timeout 3 python -m queuectl.cli worker start --count 1 || true',
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        time.sleep(4)
-        
-        # Check job is in failed or dead state
-        code1, stdout1, stderr1 = self.run_command(
-            'python -m queuectl.cli list --state failed'
-        )
-        code2, stdout2, stderr2 = self.run_command(
-            'python -m queuectl.cli list --state dead'
-        )
-        
-        is_failed_or_dead = "fail1" in stdout1 or "fail1" in stdout2
-        self.assert_equals(
-            is_failed_or_dead, True,
-            "Failed job moved to failed or dead state"
-        )
-    
-    def test_07_dlq_list(self):
-        """Test DLQ list command"""
-        code, stdout, stderr = self.run_command('python -m queuectl.cli dlq list')
-        self.assert_equals(code, 0, "DLQ list returns success code")
-    
-    def test_08_config_set(self):
-        """Test configuration management"""
-        code, stdout, stderr = self.run_command(
-            'python -m queuectl.cli config set max-retries 5'
-        )
-        self.assert_equals(code, 0, "Config set returns success code")
-        self.assert_contains(stdout, "updated", "Config set shows success")
-        
-        # Verify config was saved
-        code, stdout, stderr = self.run_command('python -m queuectl.cli config show')
-        self.assert_contains(stdout, "5", "Config shows updated value")
-    
-    def test_09_config_show(self):
-        """Test config show command"""
-        code, stdout, stderr = self.run_command('python -m queuectl.cli config show')
-        self.assert_equals(code, 0, "Config show returns success code")
-        self.assert_contains(stdout, "max-retries", "Config shows settings")
-    
-    def test_10_persistence(self):
-        """Test data persists"""
-        # Enqueue a job using add command
-        self.run_command(
-            'python -m queuectl.cli add persist1 "echo Persistent"'
-        )
-        
-        # List jobs
-        code, stdout, stderr = self.run_command('python -m queuectl.cli list')
-        self.assert_contains(stdout, "persist1", "Job persists in database")
-    
-    def test_11_multiple_jobs(self):
-        """Test multiple job enqueue"""
-        # Use add command for multiple jobs
-        for i in range(3):
-            self.run_command(
-                f'python -m queuectl.cli add multi{i} "echo Job {i}"'
-            )
-        
-        code, stdout, stderr = self.run_command('python -m queuectl.cli list --state pending')
-        
-        has_all = all(f"multi{i}" in stdout for i in range(3))
-        self.assert_equals(has_all, True, "All jobs enqueued successfully")
-    
-    def test_12_invalid_json(self):
-        """Test invalid JSON handling"""
-        # Test with enqueue command (JSON mode)
-        code, stdout, stderr = self.run_command(
-            'python -m queuectl.cli enqueue \'{"invalid json\''
-        )
-        self.assert_equals(code, 1, "Invalid JSON returns error code")
-        self.assert_contains(stdout + stderr, "Invalid JSON", "Shows JSON error")
-        
-        # Test missing required field with add command
-        code, stdout, stderr = self.run_command(
-            'python -m queuectl.cli add "" "echo test"'
-        )
-        # Should fail with empty ID
-        self.assert_equals(code, 1, "Empty ID returns error code")
-    
-    def run_all_tests(self):
-        """Run all tests"""
-        print("=" * 70)
-        print("QueueCTL Test Suite")
-        print("=" * 70)
-        print()
-        
-        self.setup()
-        
-        tests = [
-            self.test_01_enqueue_job,
-            self.test_02_enqueue_duplicate,
-            self.test_03_list_jobs,
-            self.test_04_status_command,
-            self.test_05_worker_execution,
-            self.test_06_failed_job,
-            self.test_07_dlq_list,
-            self.test_08_config_set,
-            self.test_09_config_show,
-            self.test_10_persistence,
-            self.test_11_multiple_jobs,
-            self.test_12_invalid_json,
-        ]
-        
-        for i, test in enumerate(tests, 1):
-            print(f"\n{'─' * 70}")
-            print(f"Test {i:02d}: {test.__doc__}")
-            print('─' * 70)
-            try:
-                test()
-            except Exception as e:
-                print(f"❌ FAIL: Test threw exception: {e}")
-                import traceback
-                traceback.print_exc()
-                self.failed += 1
-        
-        print("\n" + "=" * 70)
-        print(f"Test Results: {self.passed} passed, {self.failed} failed")
-        print("=" * 70)
-        
-        self.teardown()
-        
-        return self.failed == 0
+    for signum, handler in handlers.items():
+        assert signal.getsignal(signum) is handler, "Signal handler restored after command"
 
 
 if __name__ == "__main__":
-    runner = TestRunner()
-    success = runner.run_all_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -0,0 +1,318 @@
+"""
+Tests for queuectl's storage layer and the worker's use of it
+Run with: python -m pytest tests/
+"""
+
+import multiprocessing
+from pathlib import Path
+import sqlite3
+import sys
+import time
+
+import pytest
+
+# Allow running this file directly from a source checkout
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from queuectl.core import QueueManager, Worker
+from queuectl.core.worker import _new_wakeup
+from queuectl.models import Job, JobState
+from queuectl.storage import JobStorage
+from queuectl.storage import batcher as batcher_module
+from queuectl.storage.batcher import WriteBatcher
+from queuectl.utils import Config, utc_iso
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """A JobStorage on a fresh database"""
+    storage = JobStorage(str(tmp_path / "queuectl.db"))
+    yield storage
+    storage.close()
+
+
+def test_rejects_old_sqlite(tmp_path, monkeypatch):
+    """Opening storage on SQLite without RETURNING support fails clearly"""
+    monkeypatch.setattr(sqlite3, "sqlite_version_info", (3, 31, 1))
+    monkeypatch.setattr(sqlite3, "sqlite_version", "3.31.1")
+
+    with pytest.raises(RuntimeError, match=r"requires SQLite 3\.35.*found 3\.31\.1"):
+        JobStorage(str(tmp_path / "queuectl.db"))
+    assert not (tmp_path / "queuectl.db").exists()
+
+
+def make_jobs(count, start=1_700_000_000):
+    """Pending jobs job0..jobN-1, created one second apart (job0 oldest)"""
+    return [
+        Job(id=f"job{i}", command=f"echo {i}", created_at=utc_iso(start + i))
+        for i in range(count)
+    ]
+
+
+def test_claim_jobs_returns_oldest_first(storage):
+    """A claimed batch holds the oldest pending jobs, ordered by created_at"""
+    jobs = make_jobs(6)
+    # Insert out of order so row order can't stand in for created_at order
+    assert storage.save_jobs(jobs[3:] + jobs[:3])
+
+    claimed = storage.claim_jobs(4)
+
+    assert [job.id for job in claimed] == ["job0", "job1", "job2", "job3"]
+    assert all(job.state == JobState.PROCESSING for job in claimed)
+    assert storage.get_job("job4").state == JobState.PENDING
+    assert storage.claim_jobs(4) == [storage.get_job("job4"), storage.get_job("job5")]
+    assert storage.claim_jobs(4) == []
+
+
+def test_release_jobs_returns_claims_to_pending(storage):
+    """Released jobs go back to pending with their attempts unchanged"""
+    jobs = make_jobs(5)
+    jobs[3].attempts = 2
+    assert storage.save_jobs(jobs)
+
+    claimed = storage.claim_jobs(5)
+    started, unstarted = claimed[:2], claimed[2:]
+
+    assert storage.release_jobs([job.id for job in unstarted]) == 3
+    for job in unstarted:
+        stored = storage.get_job(job.id)
+        assert stored.state == JobState.PENDING
+        assert stored.attempts == job.attempts
+    assert storage.get_job("job3").attempts == 2
+    for job in started:
+        assert storage.get_job(job.id).state == JobState.PROCESSING
+
+    # Only processing jobs are released
+    storage.save_job(Job(id="job0", command="echo 0", state=JobState.COMPLETED))
+    assert storage.release_jobs(["job0"]) == 0
+    assert storage.get_job("job0").state == JobState.COMPLETED
+
+
+def test_worker_releases_unstarted_batch_on_stop(tmp_path):
+    """A worker with batch_size > 1 hands back claimed jobs it didn't start"""
+    config = Config(str(tmp_path / "queuectl_config.json"))
+    config.set('batch_size', 3)
+    queue_manager = QueueManager(config, str(tmp_path / "queuectl.db"))
+    try:
+        assert queue_manager.storage.save_jobs(make_jobs(4))
+        worker = Worker(1, queue_manager, config)
+
+        # One claim takes a batch of three; the worker starts the oldest
+        job = worker._next_job()
+        assert job.id == "job0"
+        assert [job.id for job in worker._claimed] == ["job1", "job2"]
+
+        worker.stop()
+        worker._run()
+
+        storage = queue_manager.storage
+        assert not worker._claimed
+        assert storage.get_job("job0").state == JobState.PROCESSING
+        for job_id in ("job1", "job2", "job3"):
+            job = storage.get_job(job_id)
+            assert job.state == JobState.PENDING
+            assert job.attempts == 0
+    finally:
+        queue_manager.close()
+
+
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="needs POSIX signals")
+def test_signal_exit_reported_like_shell(tmp_path):
+    """A command run without a shell and killed by signal N exits with 128+N"""
+    script = tmp_path / "killself"
+    script.write_text("#!/bin/sh\nkill -9 $$\n")
+    script.chmod(0o755)
+
+    config = Config(str(tmp_path / "queuectl_config.json"))
+    queue_manager = QueueManager(config, str(tmp_path / "queuectl.db"))
+    try:
+        job = queue_manager.enqueue("killed", str(script), max_retries=0)
+        Worker(1, queue_manager, config)._execute_job(job)
+        queue_manager.close()
+
+        job = queue_manager.storage.get_job("killed")
+        assert job.error_message == "Command exited with code 137"
+    finally:
+        queue_manager.close()
+
+def test_wakeup_survives_killed_waiter(tmp_path):
+    """A worker killed while idle doesn't block waking its siblings or stopping"""
+    wakeup = _new_wakeup()
+    dead = multiprocessing.Process(target=wakeup.acquire, kwargs={'timeout': 30})
+    dead.start()
+    time.sleep(0.2)
+    dead.kill()
+    dead.join()
+
+    sibling = multiprocessing.Process(target=wakeup.acquire, kwargs={'timeout': 30})
+    sibling.start()
+    time.sleep(0.2)
+
+    config = Config(str(tmp_path / "queuectl_config.json"))
+    queue_manager = QueueManager(config, str(tmp_path / "queuectl.db"))
+    try:
+        worker = Worker(1, queue_manager, config, wakeup=wakeup)
+        started = time.monotonic()
+        worker.stop()
+        assert time.monotonic() - started < 1
+
+        # The stop's wake-up reaches the live sibling
+        sibling.join(timeout=5)
+        assert sibling.exitcode == 0
+    finally:
+        if sibling.is_alive():
+            sibling.kill()
+        queue_manager.close()
+
+
+def test_batcher_retries_failed_write(storage, monkeypatch):
+    """A batch whose write fails is retried instead of dropped"""
+    monkeypatch.setattr(batcher_module, "WRITE_RETRY_DELAY", 0.01)
+    save_jobs = storage.save_jobs
+    calls = []
+
+    def flaky_save_jobs(jobs, replace=False):
+        # Fail like a locked database twice, then write
+        calls.append(len(jobs))
+        return len(calls) > 2 and save_jobs(jobs, replace=replace)
+
+    monkeypatch.setattr(storage, "save_jobs", flaky_save_jobs)
+
+    batcher = WriteBatcher(storage)
+    try:
+        batcher.enqueue(Job(id="done", command="true", state=JobState.COMPLETED))
+        batcher.flush()
+        assert len(calls) == 3
+        assert storage.get_job("done").state == JobState.COMPLETED
+    finally:
+        batcher.close()
+
+
+def test_batcher_writes_saves_after_close(storage):
+    """Saves made after close() are written directly, not queued behind the stop"""
+    batcher = WriteBatcher(storage)
+    batcher.close()
+    batcher.enqueue(Job(id="late", command="true"))
+    batcher.flush()
+    assert storage.get_job("late") is not None
+
+def make_baseline_db(path, jobs):
+    """Create a database with the original schema (no counters or newer indexes)"""
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("""
+            CREATE TABLE jobs (
+                id TEXT PRIMARY KEY,
+                command TEXT NOT NULL,
+                state TEXT NOT NULL,
+                attempts INTEGER DEFAULT 0,
+                max_retries INTEGER DEFAULT 3,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                next_retry_at TEXT,
+                error_message TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX idx_state ON jobs(state)")
+        conn.execute("CREATE INDEX idx_created_at ON jobs(created_at)")
+        conn.executemany(
+            "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [tuple(getattr(job, column) for column in JobStorage.COLUMNS) for job in jobs]
+        )
+    conn.close()
+
+
+def counted_states(storage):
+    """Per-state job counts computed straight from the jobs table"""
+    with storage._get_connection() as conn:
+        rows = conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+    counts = dict.fromkeys(JobStorage.STATES, 0)
+    counts.update((state, count) for state, count in rows)
+    counts['total'] = sum(counts.values())
+    return counts
+
+
+def test_stats_counters_match_jobs_table(storage):
+    """The trigger-maintained counters agree with a GROUP BY after every kind of write"""
+    def check():
+        assert storage.get_stats() == counted_states(storage)
+
+    jobs = make_jobs(6)
+    assert storage.save_jobs(jobs)
+    check()
+
+    # Upsert: a state change and an unchanged-state rewrite of existing rows
+    storage.save_job(Job(id="job0", command="echo 0", state=JobState.FAILED))
+    storage.save_job(Job(id="job1", command="echo changed"))
+    storage.save_job(Job(id="new", command="echo new", state=JobState.COMPLETED))
+    check()
+
+    # Replace-save of a batch mixing new and existing jobs
+    assert storage.save_jobs([
+        Job(id="job2", command="echo 2", state=JobState.DEAD),
+        Job(id="job3", command="echo 3", state=JobState.DEAD),
+        Job(id="extra", command="echo extra"),
+    ], replace=True)
+    check()
+
+    assert storage.delete_job("job4")
+    assert not storage.delete_job("missing")
+    check()
+
+    assert storage.retry_dlq("job2")
+    assert not storage.retry_dlq("job1")
+    check()
+
+    storage.claim_jobs(3)
+    check()
+    assert storage.get_stats()[JobState.PROCESSING] == 3
+
+
+def test_stats_counters_seeded_on_existing_database(tmp_path):
+    """Opening a database made before job_counters existed seeds the counts"""
+    path = str(tmp_path / "queuectl.db")
+    make_baseline_db(path, [
+        Job(id="a", command="true"),
+        Job(id="b", command="true", state=JobState.COMPLETED),
+        Job(id="c", command="true", state=JobState.COMPLETED),
+        Job(id="d", command="false", state=JobState.DEAD),
+    ])
+
+    storage = JobStorage(path)
+    try:
+        assert storage.get_stats() == counted_states(storage)
+        assert storage.get_stats()[JobState.COMPLETED] == 2
+    finally:
+        storage.close()
+
+
+def test_claim_promotes_due_retries_on_existing_database(tmp_path):
+    """Failed jobs past next_retry_at are claimed, including on an original-schema database"""
+    now = time.time()
+    path = str(tmp_path / "queuectl.db")
+    make_baseline_db(path, [
+        Job(id="due", command="false", state=JobState.FAILED, attempts=1,
+            created_at=utc_iso(now - 60), next_retry_at=utc_iso(now - 5)),
+        Job(id="later", command="false", state=JobState.FAILED, attempts=1,
+            created_at=utc_iso(now - 30), next_retry_at=utc_iso(now + 3600)),
+    ])
+
+    storage = JobStorage(path)
+    try:
+        # The retry queries name this index, so it must exist before any claim
+        with storage._get_connection() as conn:
+            assert conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_next_retry'"
+            ).fetchone()
+
+        assert [job.id for job in storage.get_retryable_jobs()] == ["due"]
+
+        claimed = storage.claim_jobs(5)
+        assert [job.id for job in claimed] == ["due"]
+        assert claimed[0].state == JobState.PROCESSING
+        assert claimed[0].attempts == 1
+        assert storage.get_job("later").state == JobState.FAILED
+    finally:
+        storage.close()